@@ -1,5 +1,12 @@
 from tkinter import *
+import argparse
+import json
+import math
 import random
+import time
+from collections import deque
+
+from perf_stats import mean_p95_max
 
 GAME_WIDTH = 500
 GAME_HEIGHT = 500
@@ -9,36 +16,233 @@ BODY_PARTS = 3
 SNAKE_COLOR = "#00FF00"
 Food_COLOR = "#FF0000"
 BACKGROUND_COLOR = "#000000"
+MAX_CATCH_UP = 3
+TURN_BUFFER = 3
+
+class SquareRing:
+    
+    # One rectangle per board cell, created up front. The body is the
+    # `length` slots starting at `head`; every other slot is a hidden spare.
+    # Each tick only the new head and the old tail are touched.
+    def __init__(self, canvas):
+        capacity = (GAME_WIDTH // SPACE_SIZE) * (GAME_HEIGHT // SPACE_SIZE)
+        self.canvas = canvas
+        self.items = [canvas.create_rectangle(0, 0, SPACE_SIZE, SPACE_SIZE, fill=SNAKE_COLOR, tag="snake", state=HIDDEN)
+                      for _ in range(capacity)]
+        self.head = 0
+        self.length = 0
+        
+    def push_head(self, x, y, grow):
+        
+        new_head = (self.head - 1) % len(self.items)
+        
+        if grow:
+            self.length += 1
+            self.canvas.itemconfigure(self.items[new_head], state=NORMAL)
+        else:
+            # Recycle the tail rectangle as the new head
+            tail = (self.head + self.length - 1) % len(self.items)
+            self.items[new_head], self.items[tail] = self.items[tail], self.items[new_head]
+        
+        self.canvas.coords(self.items[new_head], x, y, x + SPACE_SIZE, y + SPACE_SIZE)
+        self.head = new_head
+
+class SquareList:
+    
+    # The original rendering, kept so SquareRing can be measured against it:
+    # a new rectangle for every head and the tail's deleted each tick
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = deque()
+        
+    def push_head(self, x, y, grow):
+        
+        self.items.appendleft(self.canvas.create_rectangle(x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=SNAKE_COLOR, tag="snake"))
+        if not grow:
+            self.canvas.delete(self.items.pop())
+
+class Board:
+    
+    # How many body parts sit on each cell, plus an index of the empty cells.
+    # `slot` remembers where a cell is in `free`, so a cell leaves `free` by
+    # swapping with the last entry: occupy, release and picking a random
+    # empty cell are all O(1) however full the board is.
+    def __init__(self, rng=random):
+        self.rng = rng
+        self.columns = GAME_WIDTH // SPACE_SIZE
+        self.rows = GAME_HEIGHT // SPACE_SIZE
+        cells = self.columns * self.rows
+        self.counts = bytearray(cells)
+        self.free = list(range(cells))
+        self.slot = list(range(cells))
+        
+    def cell(self, x, y):
+        return (y // SPACE_SIZE) * self.columns + x // SPACE_SIZE
+    
+    def inside(self, x, y):
+        return 0 <= x < GAME_WIDTH and 0 <= y < GAME_HEIGHT
+    
+    def count(self, x, y):
+        return self.counts[self.cell(x, y)]
+        
+    def occupy(self, x, y):
+        cell = self.cell(x, y)
+        if self.counts[cell] == 0:
+            last = self.free.pop()
+            if last != cell:
+                i = self.slot[cell]
+                self.free[i] = last
+                self.slot[last] = i
+        self.counts[cell] += 1
+        
+    def release(self, x, y):
+        cell = self.cell(x, y)
+        self.counts[cell] -= 1
+        if self.counts[cell] == 0:
+            self.slot[cell] = len(self.free)
+            self.free.append(cell)
+            
+    def random_free(self):
+        cell = self.rng.choice(self.free)
+        return (cell % self.columns) * SPACE_SIZE, (cell // self.columns) * SPACE_SIZE
 
 class Snake:
     
-    def __init__(self):
+    # Without a canvas the snake is pure game state, for headless runs
+    def __init__(self, canvas=None, rng=random, pooled=True):
         self.body_size = BODY_PARTS
-        self.coordinates = []
-        self.squares = []
+        self.coordinates = deque()
+        self.board = Board(rng)
+        self.squares = (SquareRing if pooled else SquareList)(canvas) if canvas is not None else None
         
         
         for i in range(0, BODY_PARTS):
-            self.coordinates.append([0, 0])
+            self.move(0, 0, grow=True)
             
-        for x, y in self.coordinates:
-            square = canvas.create_rectangle(x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=SNAKE_COLOR, tag="snake")  
-            self.squares.append(square)   
+    def move(self, x, y, grow):
+        self.coordinates.appendleft((x, y))
+        if self.board.inside(x, y):
+            self.board.occupy(x, y)
+        if not grow:
+            tail_x, tail_y = self.coordinates.pop()
+            self.board.release(tail_x, tail_y)
+        if self.squares is not None:
+            self.squares.push_head(x, y, grow)
 
 class Food:
     
-    def __init__(self):
+    def __init__(self, board, canvas=None, pooled=True):
+        
+        self.board = board
+        self.canvas = canvas
+        self.pooled = pooled
+        if canvas is not None:
+            self.oval = canvas.create_oval(0, 0, SPACE_SIZE, SPACE_SIZE, fill=Food_COLOR, tag="food")
+        self.place()
         
-        x = random.randint(0, (GAME_WIDTH / SPACE_SIZE)-1) * SPACE_SIZE
-        y = random.randint(0, (GAME_HEIGHT / SPACE_SIZE)-1) * SPACE_SIZE
+    def place(self):
+        
+        # Only empty cells are candidates, so food never lands on the snake
+        x, y = self.board.random_free()
 
         self.coordinates = [x, y]
         
-        canvas.create_oval(x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=Food_COLOR, tag="food")
+        if self.canvas is None:
+            return
+        if self.pooled:
+            self.canvas.coords(self.oval, x, y, x + SPACE_SIZE, y + SPACE_SIZE)
+        else:
+            # The original rendering: a fresh oval for every meal
+            self.canvas.delete(self.oval)
+            self.oval = self.canvas.create_oval(x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=Food_COLOR, tag="food")
 
+class FrameStats:
+    
+    def __init__(self, speed_ms=SPEED, render="pooled"):
+        self.speed_ms = speed_ms  # the tick period actually run
+        self.render = render      # "pooled" or "legacy" canvas items
+        self.work = []      # seconds spent inside next_turn
+        self.jitter = []    # seconds each wake-up came after its deadline
+        self.caught_up = 0  # missed ticks run back to back
+        self.skipped = 0    # missed ticks dropped for being too far behind
+        
+    def record(self, started, finished):
+        self.work.append(finished - started)
+        
+    def record_jitter(self, late):
+        self.jitter.append(late)
+        
+    def histogram(self, samples, bucket_ms=1, buckets=50):
+        # The last bucket also collects everything past the end
+        counts = [0] * buckets
+        for sample in samples:
+            counts[min(max(int(sample * 1000 / bucket_ms), 0), buckets - 1)] += 1
+        return counts
+        
+    def summary(self):
+        lines = [f"{self.render} rendering at {self.speed_ms}ms per tick"]
+        for label, samples in (("tick work", self.work), ("tick jitter", self.jitter)):
+            if samples:
+                mean, p95, worst = mean_p95_max(samples)
+                lines.append(f"{label}: mean {mean * 1000:.2f}ms, p95 {p95 * 1000:.2f}ms, max {worst * 1000:.2f}ms over {len(samples)} ticks")
+        lines.append(f"caught up {self.caught_up} ticks, skipped {self.skipped}")
+        return "\n".join(lines)
+    
+    def export(self, path):
+        with open(path, "w") as output:
+            json.dump({
+                "speed_ms": self.speed_ms,
+                "render": self.render,
+                "bucket_ms": 1,
+                "ticks": len(self.work),
+                "caught_up": self.caught_up,
+                "skipped": self.skipped,
+                "work_histogram": self.histogram(self.work),
+                "jitter_histogram": self.histogram(self.jitter),
+            }, output, indent=2)
 
-def next_turn(snake, food):
+class TickScheduler:
+    
+    # Ticks are due on a fixed grid of time.perf_counter deadlines, so the
+    # time a tick takes never pushes the next one back. A late wake-up runs
+    # the ticks it missed back to back, up to MAX_CATCH_UP; past that the
+    # backlog is dropped and the grid moves on.
+    def __init__(self, window, period_ms, tick, stats):
+        self.window = window
+        self.period = period_ms / 1000
+        self.tick = tick
+        self.stats = stats
+        self.deadline = None
+        
+    def start(self):
+        self.deadline = time.perf_counter()
+        self.wake()
+        
+    def wake(self):
+        
+        late = time.perf_counter() - self.deadline
+        self.stats.record_jitter(late)
+        
+        missed = int(late / self.period)
+        if missed > MAX_CATCH_UP:
+            self.stats.skipped += missed
+            self.deadline += missed * self.period
+            missed = 0
+        self.stats.caught_up += missed
+        
+        for _ in range(missed + 1):
+            self.deadline += self.period
+            if not self.tick():
+                return
+        
+        delay = max(0, math.ceil((self.deadline - time.perf_counter()) * 1000))
+        self.window.after(delay, self.wake)
+
+
+def advance(snake, food, direction):
     
+    # One tick of the rules, shared by the Tk game and headless runs.
+    # Returns (ate, finished).
     x, y = snake.coordinates[0]
     
     if direction == "up":
@@ -50,53 +254,72 @@ def next_turn(snake, food):
     elif direction == "right":
          x += SPACE_SIZE      
          
-    snake.coordinates.insert(0, (x, y))
-         
-    square = canvas.create_rectangle(x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=SNAKE_COLOR)
+    ate = x == food.coordinates[0] and y == food.coordinates[1]
+    
+    snake.move(x, y, grow=ate)
+    
+    if ate:
         
-    snake.squares.insert(0, square)   
+        # A full board has nowhere left for food
+        if not snake.board.free:
+            return ate, True
+        
+        food.place()
+     
+    return ate, check_collisions(snake)
+
+def next_turn(snake, food):
+    
+    global direction
+    
+    started = time.perf_counter()
+    
+    # One buffered key press per tick, checked against the direction it turns from
+    if autopilot:
+        direction = turn(direction, autopilot.next_direction(snake, food, direction))
+    elif pending_turns:
+        direction = turn(direction, pending_turns.popleft())
     
-    if x == food.coordinates[0] and y == food.coordinates[1]:
+    ate, finished = advance(snake, food, direction)
+    
+    if ate:
         
         global score
         
         score += 1
         
         label.config(text="Score:{}".format(score))
-        
-        canvas.delete("food")
-        
-        food = Food()
-    else:
-        
-       del snake.coordinates[-1]
-    
-       canvas.delete(snake.squares[-1])
-    
-       del snake.squares[-1]
      
-    if check_collisions(snake):
+    frame_stats.record(started, time.perf_counter())
+     
+    if finished:
         game_over()
-           
-    else:                
-        window.after(SPEED, next_turn, snake, food)          
-
-def change_direction(new_direction):
     
-    global direction
+    return not finished
+
+def turn(direction, new_direction):
     
     if new_direction == 'left':
         if direction != 'right':
-            direction = new_direction
+            return new_direction
     elif new_direction == 'right':
         if direction != 'left':
-            direction = new_direction   
+            return new_direction   
     elif new_direction == 'up':
         if direction != 'down':
-            direction = new_direction 
+            return new_direction 
     elif new_direction == 'down':
         if direction != 'up':
-            direction = new_direction 
+            return new_direction 
+    
+    return direction
+
+def change_direction(new_direction):
+    
+    # Presses past a full buffer are dropped, not the oldest queued one,
+    # and a repeat of the last queued direction is no new turn
+    if len(pending_turns) < TURN_BUFFER and (not pending_turns or pending_turns[-1] != new_direction):
+        pending_turns.append(new_direction)
                                 
 
 def check_collisions(snake):
@@ -108,10 +331,10 @@ def check_collisions(snake):
     elif y < 0 or y >= GAME_HEIGHT:
         return True 
     
-    for body_part in snake.coordinates[1:]:
-        if x == body_part[0] and y == body_part[1]:
-            print("GAME OVER")
-            return True
+ 
+    # The head is counted on its own cell, so a second part there is a hit
+    if snake.board.count(x, y) > 1:
+        return True
         
     return False    
 
@@ -119,45 +342,69 @@ def game_over():
     
     canvas.delete(ALL)
     canvas.create_text(canvas.winfo_width()/2, canvas.winfo_height()/2, font=('consolas', 70), text="GAME OVER", fill="red", tag="gameover")
+    print("GAME OVER")
+    print(frame_stats.summary())
+    if autopilot:
+        print(autopilot.summary())
+    if stats_path:
+        frame_stats.export(stats_path)
     
 
-window = Tk()
-window.title("Snake game")
-window.resizable(False, False)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snake game")
+    parser.add_argument("--stats", metavar="PATH", help="write frame timing stats as JSON at game over")
+    parser.add_argument("--autopilot", action="store_true", help="let the solver play")
+    parser.add_argument("--speed", type=int, default=SPEED, help="milliseconds per tick (default %(default)s)")
+    parser.add_argument("--render", choices=["pooled", "legacy"], default="pooled",
+                        help="legacy creates and deletes canvas items every tick, to compare frame stats against")
+    args = parser.parse_args()
+
+    window = Tk()
+    window.title("Snake game")
+    window.resizable(False, False)
 
-score = 0
-direction = 'down'
+    score = 0
+    direction = 'down'
+    pending_turns = deque()
+    speed = max(1, args.speed)
+    frame_stats = FrameStats(speed, args.render)
+    stats_path = args.stats
+    autopilot = None
+    if args.autopilot:
+        from snake_autopilot import Autopilot
+        autopilot = Autopilot(GAME_WIDTH // SPACE_SIZE, GAME_HEIGHT // SPACE_SIZE)
 
-label = Label(window, text="Score:{}".format(score),font=('consolas', 40))
-label.pack()
+    label = Label(window, text="Score:{}".format(score),font=('consolas', 40))
+    label.pack()
 
-canvas = Canvas(window, bg=BACKGROUND_COLOR, height=GAME_HEIGHT, width=GAME_WIDTH)
-canvas.pack()
+    canvas = Canvas(window, bg=BACKGROUND_COLOR, height=GAME_HEIGHT, width=GAME_WIDTH)
+    canvas.pack()
 
-window.update()
+    window.update()
 
-window.width = window.winfo_width()
-window_height = window.winfo_height()
-screen_width = window.winfo_screenwidth()
-screen_height = window.winfo_screenheight()
+    window.width = window.winfo_width()
+    window_height = window.winfo_height()
+    screen_width = window.winfo_screenwidth()
+    screen_height = window.winfo_screenheight()
 
-x = int((screen_width/2) - (window.width/2))
-y = int((screen_height/2) - (window_height/2))
+    x = int((screen_width/2) - (window.width/2))
+    y = int((screen_height/2) - (window_height/2))
 
 
-window.geometry(f"{window.width}x{window_height}+{x}+{y}")
+    window.geometry(f"{window.width}x{window_height}+{x}+{y}")
 
-window.bind('<Left>', lambda event: change_direction('left'))
-window.bind('<Right>', lambda event: change_direction('right'))
-window.bind('<Up>', lambda event: change_direction('up'))
-window.bind('<Down>', lambda event: change_direction('down'))
+    window.bind('<Left>', lambda event: change_direction('left'))
+    window.bind('<Right>', lambda event: change_direction('right'))
+    window.bind('<Up>', lambda event: change_direction('up'))
+    window.bind('<Down>', lambda event: change_direction('down'))
 
 
-snake = Snake()
-food = Food()
+    pooled = args.render == "pooled"
+    snake = Snake(canvas, pooled=pooled)
+    food = Food(snake.board, canvas, pooled)
 
 
-next_turn(snake, food)
+    TickScheduler(window, speed, lambda: next_turn(snake, food), frame_stats).start()
 
 
-window.mainloop()
\ No newline at end of file
+    window.mainloop()
\ No newline at end of file
@@ -0,0 +1,226 @@
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import string
+import time
+import tracemalloc
+
+from main import ContactBook, ContactStore, run_batch
+from perf_stats import max_rss_bytes, percentile, run_isolated
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+# Whole book plus the generated records, rounded up from book_bytes_per_contact
+BYTES_PER_CONTACT = 4000
+
+
+def random_contact(rng, i):
+    # Email and mobile embed the sequence number so they never collide
+    first = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))).title()
+    last = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))).title()
+    name = f'{first} {last}'
+    email = f'{first.lower()}.{last.lower()}{i}@example.com'
+    mobile = f'03{i:09d}'
+    return name, rng.randint(18, 90), email, mobile
+
+
+def generate_contacts(seed, size):
+    rng = random.Random(seed)
+    seen = set()
+    i = 0
+    while len(seen) < size:
+        name, age, email, mobile = random_contact(rng, i)
+        i += 1
+        if name not in seen:
+            seen.add(name)
+            yield name, age, email, mobile
+
+
+def linear_search(contacts, search_name):
+    # The original menu option 5 scan
+    return [name for name in contacts if search_name.lower() in name.lower()]
+
+
+def misspell(rng, name):
+    i = rng.randrange(len(name))
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    if not latencies:
+        return {'count': 0, 'ops_per_sec': None, 'p50_us': None, 'p90_us': None, 'p99_us': None, 'max_us': None}
+    total = sum(latencies)
+    return {
+        'count': len(latencies),
+        'ops_per_sec': len(latencies) / total if total else None,
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p90_us': percentile(latencies, 0.90) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'max_us': latencies[-1] * 1e6,
+    }
+
+
+def measure(func, arguments):
+    clock = time.perf_counter
+    latencies = []
+    for args in arguments:
+        start = clock()
+        func(*args)
+        latencies.append(clock() - start)
+    return summarize(latencies)
+
+
+def available_bytes():
+    # Free physical memory, or None where sysconf can't tell (macOS, Windows)
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def run_size(size, seed, samples):
+    # Runs in a fresh worker process so max RSS belongs to this size alone
+    rng = random.Random(seed + size)
+    records = list(generate_contacts(seed, size))
+    baseline = max_rss_bytes()
+
+    book = ContactBook()
+    results = {'create': measure(book.create, records)}
+    memory = None if baseline is None else max_rss_bytes() - baseline
+
+    names = rng.sample([record[0] for record in records], min(samples, size))
+    by_name = {record[0]: record for record in records}
+    results['view'] = measure(book.view, [(name,) for name in names])
+    results['update'] = measure(book.update, [
+        (name, rng.randint(18, 90), by_name[name][2], by_name[name][3]) for name in names
+    ])
+    results['search'] = measure(book.search, [(name[2:7],) for name in names])
+    results['search_linear'] = measure(
+        lambda query: linear_search(book.contacts, query), [(name[2:7],) for name in names[:100]]
+    )
+    results['fuzzy_search'] = measure(book.fuzzy_search, [(misspell(rng, name),) for name in names])
+    results['autocomplete'] = measure(book.autocomplete, [(name[:3],) for name in names])
+    results['find_by_mobile'] = measure(book.find_by_mobile, [(by_name[name][3],) for name in names])
+    results['count'] = measure(book.count, [()] * len(names))
+    results['delete'] = measure(book.delete, [(name,) for name in names])
+
+    return {
+        'size': size,
+        'memory': {'rss_growth_bytes': memory, 'bytes_per_contact': None if memory is None else memory / size},
+        'operations': results,
+    }
+
+
+def batch_throughput(records, per_transaction=100):
+    lines = []
+    for i, (name, age, email, mobile) in enumerate(records):
+        if i % per_transaction == 0:
+            lines.append('begin')
+        lines.append(f'create,{name},{age},{email},{mobile}')
+        if i % per_transaction == per_transaction - 1:
+            lines.append('commit')
+    lines.append('commit')
+    lines += [f'search,{name[:4]}' for name, *_ in records[:1000]]
+    lines += [f'delete,{name}' for name, *_ in records]
+    lines.append('count')
+
+    start = time.perf_counter()
+    ops = run_batch(ContactBook(), lines, io.StringIO())
+    return ops / (time.perf_counter() - start)
+
+
+def bytes_per_contact(build, records):
+    tracemalloc.start()
+    store = build(records)
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del store
+    return used / len(records)
+
+
+def dict_layout(records):
+    # The original {'age', 'email', 'mobile'} dict per name
+    contacts = {}
+    for name, age, email, mobile in records:
+        contacts[name] = {'age': int(age), 'email': email, 'mobile': mobile}
+    return contacts
+
+
+def column_layout(records):
+    store = ContactStore()
+    for name, age, email, mobile in records:
+        store.put(name, age, email, mobile)
+    return store
+
+
+def book_layout(records):
+    # The whole book with every index
+    book = ContactBook()
+    for record in records:
+        book.create(*record)
+    return book
+
+
+def run_extras(seed, size=10 ** 4):
+    records = list(generate_contacts(seed, size))
+    return {
+        'size': size,
+        'batch_ops_per_sec': batch_throughput(records),
+        'dict_layout_bytes_per_contact': bytes_per_contact(dict_layout, records),
+        'column_layout_bytes_per_contact': bytes_per_contact(column_layout, records),
+        'book_bytes_per_contact': bytes_per_contact(book_layout, records),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Contact book benchmark and load test')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='comma separated book sizes, e.g. 1000,100000; each contact takes about '
+                        f'{BYTES_PER_CONTACT // 1000} KB, so 10^6 needs ~4 GB of free memory')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--samples', type=int, default=1000, help='operations timed per kind after the build')
+    parser.add_argument('--output', default='contact_benchmark.json')
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+    needed = max(sizes) * BYTES_PER_CONTACT
+    available = available_bytes()
+    if available is not None and needed > available:
+        parser.error(f'{max(sizes)} contacts need about {needed / 2 ** 30:.1f} GB, '
+                     f'only {available / 2 ** 30:.1f} GB is free')
+
+    report = {
+        'seed': args.seed,
+        'samples': args.samples,
+        'python': platform.python_version(),
+        'results': [],
+    }
+    for size in sizes:
+        result = run_isolated(run_size, size, args.seed, args.samples)
+        report['results'].append(result)
+        bytes_per_contact = result['memory']['bytes_per_contact']
+        if bytes_per_contact is None:
+            print(f'{size} contacts: RSS not available on this platform')
+        else:
+            print(f'{size} contacts: {bytes_per_contact:.0f} bytes/contact')
+        for operation, stats in result['operations'].items():
+            if not stats['count']:
+                continue
+            print(f"  {operation:<15} {stats['ops_per_sec']:>12.0f} ops/s  "
+                  f"p50 {stats['p50_us']:>9.1f}us  p99 {stats['p99_us']:>9.1f}us")
+
+    report['extras'] = run_extras(args.seed)
+    print(f"batch mode {report['extras']['batch_ops_per_sec']:.0f} ops/s, "
+          f"dict layout {report['extras']['dict_layout_bytes_per_contact']:.0f} vs "
+          f"column layout {report['extras']['column_layout_bytes_per_contact']:.0f} bytes/contact, "
+          f"whole book {report['extras']['book_bytes_per_contact']:.0f} bytes/contact")
+
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import csv
+import re
+import threading
+from itertools import islice
+
+CSV_FIELDS = ['name', 'age', 'email', 'mobile']
+VCARD_ESCAPE = re.compile(r'\\(.)')
+
+
+def read_csv(stream):
+    # A short or overlong row comes through as a nameless record, which
+    # import_records counts as skipped
+    for row in csv.DictReader(stream):
+        if None in row or None in row.values():
+            yield '', 0, '', ''
+            continue
+        yield row.get('name') or '', row.get('age') or 0, row.get('email') or '', row.get('mobile') or ''
+
+
+def write_csv(records, stream):
+    writer = csv.writer(stream)
+    writer.writerow(CSV_FIELDS)
+    for record in records:
+        writer.writerow(record)
+
+
+def _unescape(value):
+    return VCARD_ESCAPE.sub(lambda m: '\n' if m.group(1) in 'nN' else m.group(1), value)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace(',', '\\,').replace(';', '\\;').replace('\n', '\\n')
+
+
+def _unfold(stream):
+    # Lines starting with a space or tab continue the previous line
+    line = None
+    for raw in stream:
+        raw = raw.rstrip('\r\n')
+        if raw[:1] in (' ', '\t') and line is not None:
+            line += raw[1:]
+            continue
+        if line is not None:
+            yield line
+        line = raw
+    if line is not None:
+        yield line
+
+
+def read_vcard(stream):
+    card = None
+    for line in _unfold(stream):
+        key, _, value = line.partition(':')
+        prop = key.split(';')[0].rsplit('.', 1)[-1].upper()
+        if prop == 'BEGIN':
+            card = {}
+        elif prop == 'END' and card is not None:
+            yield card.get('FN', ''), card.get('X-AGE') or 0, card.get('EMAIL', ''), card.get('TEL', '')
+            card = None
+        elif card is not None and prop not in card:
+            card[prop] = _unescape(value)
+
+
+def write_vcard(records, stream):
+    for name, age, email, mobile in records:
+        stream.write('BEGIN:VCARD\r\nVERSION:3.0\r\n')
+        stream.write(f'FN:{_escape(name)}\r\n')
+        stream.write(f'X-AGE:{age}\r\n')
+        if email:
+            stream.write(f'EMAIL:{_escape(email)}\r\n')
+        if mobile:
+            stream.write(f'TEL;TYPE=CELL:{_escape(mobile)}\r\n')
+        stream.write('END:VCARD\r\n')
+
+
+def iter_contacts(book):
+    with book.lock:
+        names = list(book.contacts)
+    for name in names:
+        contact = book.view(name)
+        if contact is not None:
+            yield (name, *contact)
+
+
+def import_records(book, records, chunk_size=1000):
+    # Chunks are parsed outside the lock, then applied in one transaction each
+    # so the menu only ever waits for a single chunk.
+    imported = skipped = 0
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+        with book.transaction():
+            for name, age, email, mobile in chunk:
+                if not name or name in book or book.find_by_email(email) or book.find_by_mobile(mobile):
+                    skipped += 1
+                    continue
+                try:
+                    book.create(name, age, email, mobile)
+                    imported += 1
+                except ValueError:
+                    skipped += 1
+    return imported, skipped
+
+
+def _is_vcard(path):
+    return path.lower().endswith(('.vcf', '.vcard'))
+
+
+def import_file(book, path):
+    # utf-8-sig drops the byte order mark Excel puts before the header
+    with open(path, newline='', encoding='utf-8-sig') as stream:
+        records = read_vcard(stream) if _is_vcard(path) else read_csv(stream)
+        imported, skipped = import_records(book, records)
+    return f'imported {imported} contacts, skipped {skipped} duplicate or invalid'
+
+
+def export_file(book, path):
+    count = 0
+
+    def counted():
+        nonlocal count
+        for record in iter_contacts(book):
+            count += 1
+            yield record
+
+    with open(path, 'w', newline='', encoding='utf-8') as stream:
+        if _is_vcard(path):
+            write_vcard(counted(), stream)
+        else:
+            write_csv(counted(), stream)
+    return f'exported {count} contacts'
+
+
+class Job(threading.Thread):
+    def __init__(self, description, target, *args):
+        super().__init__(daemon=True)
+        self.description = description
+        self.target = target
+        self.args = args
+        self.result = None
+        self.error = None
+        self.start()
+
+    def run(self):
+        try:
+            self.result = self.target(*self.args)
+        except Exception as e:
+            # Anything else would end the thread with result None and the
+            # menu would report the job as finished
+            self.error = e
+
+    def report(self):
+        if self.error is not None:
+            return f'{self.description} failed: {self.error}'
+        return f'{self.description} finished: {self.result}'
@@ -0,0 +1,116 @@
+import argparse
+import json
+import random
+import re
+import time
+import tracemalloc
+
+from form_engine import Field, Form, check_record
+from perf_stats import max_rss_bytes, run_isolated
+
+DEFAULT_SIZES = [100, 300, 1000]
+CODE_PATTERN = re.compile(r'[A-Z]{2,4}\d{3}')
+
+
+def make_fields(count):
+    # A mix of every kind the engine supports
+    kinds = [
+        lambda i: Field(f'text{i}', f'Text {i}:', required=True),
+        lambda i: Field(f'int{i}', f'Number {i}:', kind='int', default='0'),
+        lambda i: Field(f'list{i}', f'List {i}:', kind='list', item=int, default='1,2,3'),
+        lambda i: Field(f'choice{i}', f'Choice {i}:', kind='choice', choices=['lecture', 'lab'], default='lecture'),
+        lambda i: Field(f'code{i}', f'Code {i}:', pattern=CODE_PATTERN, default='CS101'),
+        lambda i: Field(f'check{i}', f'Check {i}', kind='check'),
+    ]
+    return [kinds[i % len(kinds)](i) for i in range(count)]
+
+
+def benchmark_build(count):
+    # Needs a display; runs in its own process so max RSS belongs to this form
+    from tkinter import TclError, Tk, ttk
+    try:
+        window = Tk()
+    except TclError:
+        return None
+    window.withdraw()
+    fields = make_fields(count)
+    frame = ttk.Frame(window)
+    baseline = max_rss_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    Form(frame, fields, lambda values: None)
+    window.update_idletasks()
+    elapsed = time.perf_counter() - start
+    python_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rss = None if baseline is None else max_rss_bytes() - baseline
+    window.destroy()
+    return {
+        'build_ms': elapsed * 1000,
+        'build_us_per_field': elapsed / count * 1e6,
+        'python_bytes_per_field': python_bytes / count,
+        'rss_growth_bytes': rss,
+    }
+
+
+def benchmark_validation(count, edits, seed):
+    # What a keystroke costs: re-parsing the edited field only, against
+    # re-validating the whole form the way the old add_* handlers did
+    rng = random.Random(seed)
+    fields = make_fields(count)
+    record = {field.name: field.default for field in fields}
+    record.update({field.name: 'x' for field in fields if field.required})
+    targets = [rng.choice(fields) for _ in range(edits)]
+    clock = time.perf_counter
+
+    start = clock()
+    for field in targets:
+        field.parse(record[field.name])
+    incremental = clock() - start
+
+    start = clock()
+    for _ in targets:
+        check_record(fields, record)
+    full = clock() - start
+    return {'incremental_us_per_edit': incremental / edits * 1e6, 'full_us_per_edit': full / edits * 1e6}
+
+
+def run_size(count, edits, seed):
+    return {
+        'fields': count,
+        'build': benchmark_build(count),
+        'validation': benchmark_validation(count, edits, seed),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Form engine build and validation benchmark')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='comma separated field counts')
+    parser.add_argument('--edits', type=int, default=2000, help='simulated keystrokes per size')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='form_benchmark.json')
+    args = parser.parse_args()
+
+    report = {'seed': args.seed, 'edits': args.edits, 'results': []}
+    for count in (int(size) for size in args.sizes.split(',')):
+        result = run_isolated(run_size, count, args.edits, args.seed)
+        report['results'].append(result)
+        build = result['build']
+        if build is None:
+            print(f'{count} fields: build not measured, no display available')
+        else:
+            rss = 'n/a' if build['rss_growth_bytes'] is None else f"+{build['rss_growth_bytes'] / 1024:.0f}KB"
+            print(f"{count} fields: built in {build['build_ms']:.1f}ms, "
+                  f"{build['python_bytes_per_field']:.0f} Python bytes/field, RSS {rss}")
+        validation = result['validation']
+        print(f"  per edit: incremental {validation['incremental_us_per_edit']:.2f}us, "
+              f"whole form {validation['full_us_per_edit']:.2f}us")
+
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == "__main__":
+    main()
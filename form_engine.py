@@ -0,0 +1,134 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class Field:
+
+    # One input of a form. kind picks how the text is parsed: "text", "int",
+    # "list" (comma separated, each item through `item`), "choice" (one of
+    # choices) or "check" (a checkbox). Giving choices shows a combobox.
+    def __init__(self, name, label, kind="text", default="", required=False, choices=None,
+                 pattern=None, message=None, item=str):
+        self.name = name
+        self.label = label
+        self.kind = kind
+        self.default = default
+        self.required = required
+        self.choices = choices
+        self.pattern = pattern
+        self.message = message
+        self.item = item
+
+    def parse(self, value):
+        # The typed value, or ValueError with a message for the user
+        if self.kind == "check":
+            return int(bool(value))
+        text = str(value).strip()
+        label = self.label.rstrip(":")
+        if not text:
+            if self.required:
+                raise ValueError(f"{label} is required")
+            return None if self.kind == "int" else [] if self.kind == "list" else text
+        if self.pattern is not None and not self.pattern.fullmatch(text):
+            raise ValueError(self.message or f"{label} is not valid")
+        if self.kind == "int":
+            try:
+                return int(text)
+            except ValueError:
+                raise ValueError(f"{label} must be a whole number") from None
+        if self.kind == "list":
+            try:
+                return [self.item(part.strip()) for part in text.split(",") if part.strip()]
+            except ValueError:
+                raise ValueError(f"{label} has an invalid item") from None
+        if self.kind == "choice" and text not in self.choices:
+            raise ValueError(f"{label} must be one of {', '.join(self.choices)}")
+        return text
+
+
+def check_record(fields, record):
+    # Parses a whole record against a schema: (typed values, error messages)
+    values, errors = {}, []
+    for field in fields:
+        try:
+            values[field.name] = field.parse(record.get(field.name, field.default))
+        except ValueError as e:
+            errors.append(str(e))
+    return values, errors
+
+
+class Form:
+
+    # Lays out a label and an input per Field on parent's grid, starting at
+    # (row, column). Every edit re-parses only the field that changed, so
+    # submit already holds typed values and just hands them to on_submit as
+    # one dict. on_submit may return a message to show, or raise ValueError.
+    def __init__(self, parent, fields, on_submit, submit_text="Submit", row=0, column=0,
+                 widgets=ttk, reset=True):
+        self.fields = fields
+        self.on_submit = on_submit
+        self.reset_after_submit = reset
+        self.variables = {}
+        self.inputs = {}
+        self.values = {}
+        self.errors = {}
+        self.quiet = False
+
+        for i, field in enumerate(fields):
+            if field.kind == "check":
+                variable = tk.BooleanVar(parent, value=bool(field.default))
+                widget = widgets.Checkbutton(parent, text=field.label, variable=variable)
+            else:
+                variable = tk.StringVar(parent, value=str(field.default))
+                widgets.Label(parent, text=field.label).grid(row=row + i, column=column, padx=5, pady=5)
+                if field.choices is not None:
+                    widget = ttk.Combobox(parent, textvariable=variable, values=field.choices)
+                else:
+                    widget = widgets.Entry(parent, textvariable=variable)
+            widget.grid(row=row + i, column=column + 1, padx=5, pady=5)
+            variable.trace_add("write", lambda *_, field=field: self.edited(field))
+            self.variables[field.name] = variable
+            self.inputs[field.name] = widget
+            self.check(field)
+
+        row += len(fields)
+        widgets.Button(parent, text=submit_text, command=self.submit).grid(row=row, column=column, columnspan=2, pady=10)
+        self.status = widgets.Label(parent, text="")
+        self.status.grid(row=row + 1, column=column, columnspan=2)
+
+    def check(self, field):
+        try:
+            self.values[field.name] = field.parse(self.variables[field.name].get())
+            self.errors.pop(field.name, None)
+        except ValueError as e:
+            self.errors[field.name] = str(e)
+
+    def edited(self, field):
+        self.check(field)
+        if not self.quiet:
+            self.show(self.errors.get(field.name, ""))
+
+    def show(self, text, color="red"):
+        self.status.configure(text=text, foreground=color)
+
+    def set(self, name, value):
+        self.variables[name].set(value)
+
+    def reset(self):
+        self.quiet = True
+        for field in self.fields:
+            self.variables[field.name].set(bool(field.default) if field.kind == "check" else field.default)
+        self.quiet = False
+
+    def submit(self):
+        if self.errors:
+            self.show("; ".join(self.errors.values()))
+            return
+        try:
+            message = self.on_submit(dict(self.values))
+        except ValueError as e:
+            self.show(f"Invalid input: {e}")
+            return
+        self.show(message or "", "green")
+        if self.reset_after_submit:
+            self.reset()
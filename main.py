@@ -1,75 +1,790 @@
-contacts = {}
-
-while True:
-    print('/nContact Book App' )
-    print('1, Create contact')
-    print('2, Viwe contact')
-    print('3, Update contact')
-    print('4, Delete contact')
-    print('5, Serach contact')
-    print('6, Count contact')
-    print('7, Exit')
-    
-    
-    choice = input('Enter your choice = ') 
-    
-    if choice == '1':
-        name = input('Enter your name = ')
-        if name in contacts:
-            print(f'Contact name {name} already exists!')
+import bisect
+import csv
+import functools
+import heapq
+import itertools
+import re
+import sys
+import threading
+import time
+from array import array
+from collections import defaultdict, namedtuple
+from collections.abc import Mapping
+from contextlib import contextmanager
+from operator import itemgetter
+
+import contact_io
+
+NO_MATCHES = frozenset()
+PLUS = 0x80  # mobile_widths flag for a leading '+'
+PHONE_QUERY = re.compile(r'\+?[\d\s().-]*\d[\d\s().-]*')
+BLOCK_SIZE = 512  # a sorted block past this length is split in two
+
+Contact = namedtuple('Contact', ['age', 'email', 'mobile'])
+
+SOUNDEX_CODES = {
+    ch: code
+    for letters, code in (('bfpv', '1'), ('cgjkqsxz', '2'), ('dt', '3'), ('l', '4'), ('mn', '5'), ('r', '6'))
+    for ch in letters
+}
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+def normalize_mobile(mobile):
+    return ''.join(ch for ch in str(mobile) if ch.isdigit())
+
+
+def soundex(word):
+    word = ''.join(ch for ch in word.lower() if ch.isalpha())
+    if not word:
+        return ''
+    key = word[0].upper()
+    last = SOUNDEX_CODES.get(word[0], '')
+    for ch in word[1:]:
+        code = SOUNDEX_CODES.get(ch, '')
+        if code and code != last:
+            key += code
+        if ch not in 'hw':
+            last = code
+    return (key + '000')[:4]
+
+
+def edit_distance(a, b, limit=None):
+    # Myers' bit-parallel Levenshtein: one bit per letter of a, so each
+    # letter of b costs a few int operations instead of a row of the table.
+    # With a limit, anything further apart comes back as limit + 1
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a) if limit is None else min(len(a), limit + 1)
+    matches = {}
+    for i, ch in enumerate(b):
+        matches[ch] = matches.get(ch, 0) | 1 << i
+    mask = (1 << len(b)) - 1
+    top = 1 << (len(b) - 1)
+    plus, minus, distance = mask, 0, len(b)
+    for ch in a:
+        eq = matches.get(ch, 0)
+        xv = eq | minus
+        xh = (((eq & plus) + plus) ^ plus) | eq
+        h_plus = minus | ~(xh | plus) & mask
+        h_minus = plus & xh
+        if h_plus & top:
+            distance += 1
+        elif h_minus & top:
+            distance -= 1
+        h_plus = (h_plus << 1 | 1) & mask
+        h_minus = h_minus << 1 & mask
+        plus = h_minus | ~(xv | h_plus) & mask
+        minus = h_plus & xv
+    if limit is not None and distance > limit:
+        return limit + 1
+    return distance
+
+
+class ContactStore(Mapping):
+    # Column layout: one packed array or list per field, a row number per name.
+    # Rows are swap-removed on delete so the columns never have holes.
+    def __init__(self):
+        self.rows = {}
+        self.names = []
+        self.ages = array('B')
+        self.mobiles = array('Q')
+        self.mobile_widths = array('B')  # digit count, keeps leading zeros, | PLUS
+        self.email_users = []
+        self.email_domains = array('I')
+        self.domains = [None]            # interned domains, 0 means no '@'
+        self.domain_ids = {}
+
+    def __getitem__(self, name):
+        row = self.rows[name]
+        return Contact(self.ages[row], self._email(row), self._mobile(row))
+
+    def __contains__(self, name):
+        return name in self.rows
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _email(self, row):
+        domain = self.domains[self.email_domains[row]]
+        user = self.email_users[row]
+        return user if domain is None else f'{user}@{domain}'
+
+    def _mobile(self, row):
+        width = self.mobile_widths[row]
+        digits = width & ~PLUS
+        if not digits:
+            return ''
+        return f"{'+' if width & PLUS else ''}{self.mobiles[row]:0{digits}d}"
+
+    def _domain_id(self, domain):
+        domain_id = self.domain_ids.get(domain)
+        if domain_id is None:
+            domain_id = self.domain_ids[domain] = len(self.domains)
+            self.domains.append(sys.intern(domain))
+        return domain_id
+
+    def _pack(self, age, email, mobile):
+        age = int(age)
+        if not 0 <= age <= 255:
+            raise ValueError('Age must be between 0 and 255')
+        plus = PLUS if str(mobile).strip().startswith('+') else 0
+        mobile = normalize_mobile(mobile)
+        if len(mobile) > 19:
+            raise ValueError(f'Mobile number {mobile} is too long')
+        user, at, domain = email.partition('@')
+        domain_id = self._domain_id(domain) if at else 0
+        return age, user, domain_id, int(mobile or 0), len(mobile) | (plus if mobile else 0)
+
+    def put(self, name, age, email, mobile):
+        age, user, domain_id, number, width = self._pack(age, email, mobile)
+        row = self.rows.get(name)
+        if row is None:
+            row = self.rows[name] = len(self.names)
+            self.names.append(name)
+            self.ages.append(age)
+            self.email_users.append(user)
+            self.email_domains.append(domain_id)
+            self.mobiles.append(number)
+            self.mobile_widths.append(width)
         else:
-            age = input('Enter age = ')
-            email = input('Enter email = ')
-            mobile = input('Enter mobile number = ')
-            contacts[name] = {'age':int(age), 'email':email, 'mobile':mobile} 
-            print(f'Contact name {name} has been created successfully!')
-
-    elif choice == '2':
-        name = input('Enter your name to viwe= ')
-        if name in contacts:
-            contact = contacts[name]
-            print(f'Name: {name}, Age: {age}, Email: {email}, Mobile: {mobile}')
+            self.ages[row] = age
+            self.email_users[row] = user
+            self.email_domains[row] = domain_id
+            self.mobiles[row] = number
+            self.mobile_widths[row] = width
+
+    def pop(self, name):
+        contact = self[name]
+        row = self.rows.pop(name)
+        last = len(self.names) - 1
+        if row != last:
+            moved = self.names[last]
+            self.rows[moved] = row
+            self.names[row] = moved
+            for column in (self.ages, self.email_users, self.email_domains, self.mobiles, self.mobile_widths):
+                column[row] = column[last]
+        for column in (self.names, self.ages, self.email_users, self.email_domains, self.mobiles, self.mobile_widths):
+            column.pop()
+        return contact
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# A sorted sequence kept as a list of short sorted blocks (lists or arrays),
+# every item of a block below those of the next. Inserts and removes shift
+# one block of at most BLOCK_SIZE items, however long the sequence grows.
+# Only a sole first block is ever empty, so block 0 is never keyed.
+def _block(blocks, item):
+    return bisect.bisect_right(blocks, item, 1, key=itemgetter(0)) - 1
+
+
+def sorted_insert(blocks, item):
+    # New contact numbers mostly sort last, which needs no search
+    i = len(blocks) - 1
+    if blocks[i] and item < blocks[i][-1]:
+        i = _block(blocks, item)
+    block = blocks[i]
+    bisect.insort(block, item)
+    if len(block) > BLOCK_SIZE:
+        blocks.insert(i + 1, block[BLOCK_SIZE // 2:])
+        del block[BLOCK_SIZE // 2:]
+
+
+def sorted_remove(blocks, item):
+    i = _block(blocks, item)
+    block = blocks[i]
+    j = bisect.bisect_left(block, item)
+    if j < len(block) and block[j] == item:
+        del block[j]
+        if not block and len(blocks) > 1:
+            del blocks[i]
+
+
+def sorted_contains(blocks, item):
+    block = blocks[_block(blocks, item)]
+    j = bisect.bisect_left(block, item)
+    return j < len(block) and block[j] == item
+
+
+def sorted_from(blocks, item):
+    # Items from item onwards, in order
+    i = _block(blocks, item)
+    yield from itertools.islice(blocks[i], bisect.bisect_left(blocks[i], item), None)
+    for block in itertools.islice(blocks, i + 1, None):
+        yield from block
+
+
+def sorted_len(blocks):
+    return sum(map(len, blocks))
+
+
+class SearchIndex:
+    # Contacts are numbered, and each trigram posting is a blocked sorted
+    # array of those numbers rather than a set of names. Prefix terms are
+    # kept as 'term\0name' strings in one blocked sorted list.
+    def __init__(self):
+        self.ids = {}                  # name -> contact number
+        self.names = []                # contact number -> name, None while free
+        self.free = []
+        self.grams = {}                # trigram -> blocks of contact numbers
+        self.terms = [[]]              # blocks of 'term\0name' for prefix lookups
+        self.short = set()             # names with a term too short for a trigram
+
+    def _terms(self, name, contact):
+        # Mobiles are kept as bare digits, so 0300-1111111 and 03001111111 match alike
+        return [name.lower(), contact.email.lower(), normalize_mobile(contact.mobile)]
+
+    def add(self, name, contact):
+        contact_id = self.free.pop() if self.free else len(self.names)
+        if contact_id == len(self.names):
+            self.names.append(name)
         else:
-             print(f'Contact name not found!')
-             
-    elif choice == '3':
-        name = input('Enter name to update contact =')
-        if name in contacts:
-            age = input('Enter update age = ')
-            email = input('Enter update email = ')
-            mobile = input('Enter update number = ')
-            contacts[name] = {'age':int(age), 'email':email, 'mobile':mobile}
+            self.names[contact_id] = name
+        self.ids[name] = contact_id
+        terms = self._terms(name, contact)
+        for gram in set().union(*map(trigrams, terms)):
+            postings = self.grams.get(gram)
+            if postings is None:
+                self.grams[gram] = [array('I', [contact_id])]
+            elif postings[-1][-1] < contact_id and len(postings[-1]) < BLOCK_SIZE:
+                postings[-1].append(contact_id)
+            else:
+                sorted_insert(postings, contact_id)
+        for term in terms:
+            if term:
+                sorted_insert(self.terms, f'{term}\0{name}')
+            if 0 < len(term) < 3:
+                self.short.add(name)
+
+    def remove(self, name, contact):
+        contact_id = self.ids.pop(name)
+        terms = self._terms(name, contact)
+        for gram in set().union(*map(trigrams, terms)):
+            postings = self.grams[gram]
+            sorted_remove(postings, contact_id)
+            if not postings[0]:
+                del self.grams[gram]
+        for term in terms:
+            if term:
+                sorted_remove(self.terms, f'{term}\0{name}')
+        self.short.discard(name)
+        self.names[contact_id] = None
+        self.free.append(contact_id)
+
+    def search(self, query, contacts):
+        query = query.lower()
+        if PHONE_QUERY.fullmatch(query):
+            query = normalize_mobile(query)
+        if not query:
+            return sorted(contacts)
+        if len(query) < 3:
+            # Any one or two letters of a longer term sit inside one of its
+            # trigrams, so the postings of the trigrams holding the query are
+            # the matches themselves; only the few short terms need a look
+            ids = set()
+            for gram, postings in self.grams.items():
+                if query in gram:
+                    ids.update(itertools.chain.from_iterable(postings))
+            matches = set(map(self.names.__getitem__, ids))
+            matches.update(name for name in self.short
+                           if any(query in term for term in self._terms(name, contacts[name])))
+            return sorted(matches)
+        postings = [self.grams.get(gram) for gram in trigrams(query)]
+        if None in postings:
+            return []
+        postings.sort(key=sorted_len)
+        candidates = set(itertools.chain.from_iterable(postings[0]))
+        for blocks in postings[1:]:
+            # Probe a far longer posting number by number, walk a similar one
+            if len(candidates) * 32 < sorted_len(blocks):
+                candidates = {i for i in candidates if sorted_contains(blocks, i)}
+            else:
+                candidates.intersection_update(itertools.chain.from_iterable(blocks))
+        return sorted(
+            name for name in map(self.names.__getitem__, candidates)
+            if any(query in term for term in self._terms(name, contacts[name]))
+        )
+
+    def prefix(self, prefix, limit=10):
+        prefix = prefix.lower()
+        names = []
+        for key in sorted_from(self.terms, prefix):
+            term, _, name = key.partition('\0')
+            if not term.startswith(prefix) or len(names) == limit:
+                break
+            if name not in names:
+                names.append(name)
+        return names
+
+
+def synchronized(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def single_deletes(word):
+    return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+class FuzzyIndex:
+    # Symmetric-delete lookup: two words within one edit (or one transposition)
+    # share a variant with at most one letter deleted, so candidates come from
+    # a handful of dict hits instead of an edit distance against every word.
+    # Phonetic buckets add further-apart spellings such as Mohamad/Muhammad.
+    # Words get integer ids and the variant table maps the hash of a variant
+    # to one id (a tuple when several words share it) rather than keeping a
+    # set of strings per variant; a hash clash only adds a candidate that the
+    # edit distance then drops. Phonetic buckets are split by word length, so
+    # a search only measures sound-alikes of about its own length.
+    def __init__(self):
+        self.ids = {}         # lower-case name word -> id
+        self.words = []       # id -> word, None while the id is free
+        self.owners = []      # id -> name, or a set of the names sharing the word
+        self.free = []
+        self.variants = {}    # hash of the word with <= 1 letter deleted -> id(s)
+        self.phonetic = defaultdict(set)  # (soundex key, word length) -> ids
+
+    def add(self, name):
+        for token in set(name.lower().split()):
+            word_id = self.ids.get(token)
+            if word_id is None:
+                word_id = self.free.pop() if self.free else len(self.words)
+                if word_id == len(self.words):
+                    self.words.append(token)
+                    self.owners.append(name)
+                else:
+                    self.words[word_id] = token
+                    self.owners[word_id] = name
+                self.ids[token] = word_id
+                self._index(token, word_id)
+                continue
+            owners = self.owners[word_id]
+            if isinstance(owners, set):
+                owners.add(name)
+            elif owners != name:
+                self.owners[word_id] = {owners, name}
+
+    def remove(self, name):
+        for token in set(name.lower().split()):
+            word_id = self.ids.get(token)
+            if word_id is None:
+                continue
+            owners = self.owners[word_id]
+            if isinstance(owners, set):
+                owners.discard(name)
+                if len(owners) > 1:
+                    continue
+                self.owners[word_id] = owners.pop()
+                continue
+            if owners != name:
+                continue
+            del self.ids[token]
+            self._unindex(token, word_id)
+            self.words[word_id] = self.owners[word_id] = None
+            self.free.append(word_id)
+
+    def _index(self, token, word_id):
+        for variant in single_deletes(token):
+            key = hash(variant)
+            held = self.variants.get(key)
+            if held is None:
+                self.variants[key] = word_id
+            elif isinstance(held, tuple):
+                self.variants[key] = held + (word_id,)
+            else:
+                self.variants[key] = (held, word_id)
+        self.phonetic[soundex(token), len(token)].add(word_id)
+
+    def _unindex(self, token, word_id):
+        for variant in single_deletes(token):
+            key = hash(variant)
+            held = self.variants.get(key)
+            if held == word_id:
+                del self.variants[key]
+            elif isinstance(held, tuple):
+                rest = tuple(i for i in held if i != word_id)
+                self.variants[key] = rest[0] if len(rest) == 1 else rest
+        key = soundex(token), len(token)
+        ids = self.phonetic.get(key)
+        if ids is not None:
+            ids.discard(word_id)
+            if not ids:
+                del self.phonetic[key]
+
+    def _word_scores(self, word):
+        max_distance = max(1, len(word) // 3)
+        key = soundex(word)
+        alike = set().union(*(self.phonetic.get((key, length), NO_MATCHES)
+                              for length in range(len(word) - max_distance, len(word) + max_distance + 1)))
+        candidates = set(alike)
+        for variant in single_deletes(word):
+            held = self.variants.get(hash(variant))
+            if isinstance(held, tuple):
+                candidates.update(held)
+            elif held is not None:
+                candidates.add(held)
+
+        scores = {}
+        for word_id in candidates:
+            sounds_alike = word_id in alike
+            # Phonetic matches may be further off; past the cap they tie
+            distance = edit_distance(word, self.words[word_id], max_distance + 2 * sounds_alike)
+            if distance > max_distance and not sounds_alike:
+                continue
+            score = distance - 0.5 * sounds_alike
+            owners = self.owners[word_id]
+            for name in owners if isinstance(owners, set) else (owners,):
+                if score < scores.get(name, score + 1):
+                    scores[name] = score
+        return scores
+
+    def search(self, query, limit=10):
+        # Score = summed edit distance of each query word to the closest name
+        # word, minus half a point for a phonetic match; lower ranks higher.
+        words = query.lower().split()
+        per_word = [self._word_scores(word) for word in words]
+        candidates = set().union(*per_word)
+        return heapq.nsmallest(limit, candidates, key=lambda name: (
+            sum(scores.get(name, len(word)) for word, scores in zip(words, per_word)), name
+        ))
+
+
+class ContactBook:
+    def __init__(self):
+        self.contacts = ContactStore()
+        self.index = SearchIndex()
+        self.fuzzy = FuzzyIndex()
+        self.by_email = {}   # normalised email -> name
+        self.by_mobile = {}  # normalised mobile -> name
+        self.undo = None     # inverse operations of the open transaction
+        self.lock = threading.RLock()  # shared with background import/export
+
+    def __contains__(self, name):
+        return name in self.contacts
+
+    def __len__(self):
+        return len(self.contacts)
+
+    def _check_unique(self, name, email, mobile):
+        owner = self.by_email.get(normalize_email(email))
+        if owner is not None and owner != name:
+            raise ValueError(f'Email {email} already belongs to {owner}!')
+        owner = self.by_mobile.get(normalize_mobile(mobile))
+        if owner is not None and owner != name:
+            raise ValueError(f'Mobile number {mobile} already belongs to {owner}!')
+
+    def _link(self, name, contact):
+        self.index.add(name, contact)
+        self.fuzzy.add(name)
+        email = normalize_email(contact.email)
+        mobile = normalize_mobile(contact.mobile)
+        if email:
+            self.by_email[email] = name
+        if mobile:
+            self.by_mobile[mobile] = name
+
+    def _unlink(self, name, contact):
+        self.index.remove(name, contact)
+        self.fuzzy.remove(name)
+        self.by_email.pop(normalize_email(contact.email), None)
+        self.by_mobile.pop(normalize_mobile(contact.mobile), None)
+
+    @synchronized
+    def create(self, name, age, email, mobile):
+        if name in self.contacts:
+            raise ValueError(f'Contact name {name} already exists!')
+        self._check_unique(name, email, mobile)
+        self.contacts.put(name, age, email, mobile)
+        self._link(name, self.contacts[name])
+        self._record('delete', name)
+
+    @synchronized
+    def view(self, name):
+        return self.contacts.get(name)
+
+    @synchronized
+    def update(self, name, age, email, mobile):
+        if name not in self.contacts:
+            raise ValueError('Contact name not found!')
+        self._check_unique(name, email, mobile)
+        old = self.contacts[name]
+        self.contacts.put(name, age, email, mobile)
+        self._unlink(name, old)
+        self._link(name, self.contacts[name])
+        self._record('update', name, *old)
+
+    @synchronized
+    def delete(self, name):
+        if name not in self.contacts:
+            raise ValueError('Contact not found')
+        old = self.contacts.pop(name)
+        self._unlink(name, old)
+        self._record('create', name, *old)
+
+    def _record(self, *operation):
+        if self.undo is not None:
+            self.undo.append(operation)
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            outer, self.undo = self.undo, []
+            try:
+                yield self
+            except Exception:
+                undo, self.undo = self.undo, None
+                for operation, *args in reversed(undo):
+                    getattr(self, operation)(*args)
+                self.undo = outer
+                raise
+            if outer is not None:
+                outer.extend(self.undo)
+            self.undo = outer
+
+    @synchronized
+    def find_by_email(self, email):
+        return self.by_email.get(normalize_email(email))
+
+    @synchronized
+    def find_by_mobile(self, mobile):
+        return self.by_mobile.get(normalize_mobile(mobile))
+
+    @synchronized
+    def search(self, query):
+        return [(name, self.contacts[name]) for name in self.index.search(query, self.contacts)]
+
+    @synchronized
+    def fuzzy_search(self, query, limit=10):
+        return [(name, self.contacts[name]) for name in self.fuzzy.search(query, limit)]
+
+    @synchronized
+    def autocomplete(self, prefix, limit=10):
+        return self.index.prefix(prefix, limit)
+
+    @synchronized
+    def count(self):
+        return len(self.contacts)
+
+
+BATCH_COMMANDS = {'create': 4, 'view': 1, 'update': 4, 'delete': 1, 'search': 1, 'fuzzy': 1, 'count': 0}
+
+
+def run_command(book, command, args):
+    if command not in BATCH_COMMANDS:
+        raise ValueError(f'Invalid input: {command}')
+    if len(args) != BATCH_COMMANDS[command]:
+        raise ValueError(f'{command} expects {BATCH_COMMANDS[command]} arguments, got {len(args)}')
+
+    if command == 'create':
+        book.create(*args)
+        return [f'Contact name {args[0]} has been created successfully!']
+    elif command == 'view':
+        contact = book.view(args[0])
+        if not contact:
+            # A lookup changes nothing, so there is nothing to roll back
+            return ['Contact name not found!']
+        return [f"Name: {args[0]}, Age: {contact.age}, Email: {contact.email}, Mobile: {contact.mobile}"]
+    elif command == 'update':
+        book.update(*args)
+        return [f'Contact name {args[0]} has been updated successfully!']
+    elif command == 'delete':
+        book.delete(args[0])
+        return [f'Contact name {args[0]} has been deleted successfully!']
+    elif command == 'search':
+        found = book.search(args[0])
+        if not found:
+            return ['No contact found with that name']
+        return [f"Found - Name {name}, Age: {contact.age}, Mobile Number: {contact.mobile}, Email: {contact.email}"
+                for name, contact in found]
+    elif command == 'fuzzy':
+        found = book.fuzzy_search(args[0])
+        if not found:
+            return ['No contact found with that name']
+        return [f"Closest - Name {name}, Age: {contact.age}, Mobile Number: {contact.mobile}, Email: {contact.email}"
+                for name, contact in found]
+    else:
+        return [f'Total  contacts in your book : {book.count()}']
+
+
+def run_transaction(book, commands):
+    # All commands apply or none do; output is only kept for committed work
+    lines = []
+    try:
+        with book.transaction():
+            for command, args in commands:
+                lines.extend(run_command(book, command, args))
+    except ValueError as e:
+        return [f'Rolled back {len(commands)} command(s): {e}']
+    return lines
+
+
+def run_batch(book, lines, out, flush_every=1000):
+    # One command per CSV row, e.g. create,Ali Khan,30,ali@example.com,03001234567.
+    # Rows between begin and commit run as one transaction, others autocommit.
+    buffer = []
+    ops = 0
+    transaction = None
+    for row in csv.reader(lines):
+        if not row or row[0].startswith('#'):
+            continue
+        command, args = row[0].strip().lower(), [arg.strip() for arg in row[1:]]
+        if command == 'begin':
+            if transaction:
+                buffer.append(f'Discarded {len(transaction)} command(s) without commit')
+            transaction = []
+            continue
+        elif command == 'rollback':
+            transaction = None
+            continue
+        elif command == 'commit':
+            commands, transaction = transaction or [], None
+        elif transaction is not None:
+            transaction.append((command, args))
+            continue
         else:
-            print(f'Contact name not found!')
-    
-    elif choice == '4':
-        name = input('Enter contact name to delete = ')
-        if name in contacts:
-            del contacts[name]
-            print(f'Contact name {name} has been deleted successfully!')
+            commands = [(command, args)]
+
+        buffer.extend(run_transaction(book, commands))
+        ops += len(commands)
+        if len(buffer) >= flush_every:
+            out.write('\n'.join(buffer) + '\n')
+            buffer = []
+
+    if transaction:
+        buffer.append(f'Discarded {len(transaction)} command(s) without commit')
+    if buffer:
+        out.write('\n'.join(buffer) + '\n')
+    out.flush()
+    return ops
+
+
+def batch(path):
+    book = ContactBook()
+    start = time.perf_counter()
+    if path == '-':
+        ops = run_batch(book, sys.stdin, sys.stdout)
+    else:
+        with open(path, newline='') as commands:
+            ops = run_batch(book, commands, sys.stdout)
+    elapsed = time.perf_counter() - start
+    print(f'{ops} operations in {elapsed:.2f}s ({ops / elapsed:.0f} ops/s)', file=sys.stderr)
+
+
+def main():
+    book = ContactBook()
+    jobs = []
+
+    while True:
+        for job in [job for job in jobs if not job.is_alive()]:
+            print(job.report())
+            jobs.remove(job)
+
+        print('/nContact Book App' )
+        print('1, Create contact')
+        print('2, Viwe contact')
+        print('3, Update contact')
+        print('4, Delete contact')
+        print('5, Serach contact')
+        print('6, Count contact')
+        print('7, Exit')
+        print('8, Import contacts')
+        print('9, Export contacts')
+
+        choice = input('Enter your choice = ')
+
+        if choice == '1':
+            name = input('Enter your name = ')
+            if name in book:
+                print(f'Contact name {name} already exists!')
+            else:
+                age = input('Enter age = ')
+                email = input('Enter email = ')
+                mobile = input('Enter mobile number = ')
+                try:
+                    book.create(name, age, email, mobile)
+                    print(f'Contact name {name} has been created successfully!')
+                except ValueError as e:
+                    print(e)
+
+        elif choice == '2':
+            name = input('Enter your name to viwe= ')
+            contact = book.view(name)
+            if contact:
+                print(f"Name: {name}, Age: {contact.age}, Email: {contact.email}, Mobile: {contact.mobile}")
+            else:
+                print(f'Contact name not found!')
+
+        elif choice == '3':
+            name = input('Enter name to update contact =')
+            if name in book:
+                age = input('Enter update age = ')
+                email = input('Enter update email = ')
+                mobile = input('Enter update number = ')
+                try:
+                    book.update(name, age, email, mobile)
+                except ValueError as e:
+                    print(e)
+            else:
+                print(f'Contact name not found!')
+
+        elif choice == '4':
+            name = input('Enter contact name to delete = ')
+            if name in book:
+                book.delete(name)
+                print(f'Contact name {name} has been deleted successfully!')
+            else:
+                print('Contact not found')
+
+        elif choice == '5':
+            search_name = input('Enter contact name to search =')
+            found = book.search(search_name)
+            for name, contact in found:
+                print(f"Found - Name {name}, Age: {contact.age}, Mobile Number: {contact.mobile}, Email: {contact.email}")
+            if not found:
+                found = book.fuzzy_search(search_name)
+                for name, contact in found:
+                    print(f"Closest - Name {name}, Age: {contact.age}, Mobile Number: {contact.mobile}, Email: {contact.email}")
+            if not found:
+                print('No contact found with that name')
+
+        elif choice == '6':
+            print(f'Total  contacts in your book : {book.count()}')
+
+        elif choice == '7':
+            print('Good bye...Closing the program')
+            break
+
+        elif choice == '8':
+            path = input('Enter CSV or vCard (.vcf) file to import = ')
+            jobs.append(contact_io.Job(f'Import of {path}', contact_io.import_file, book, path))
+            print(f'Importing {path} in the background...')
+
+        elif choice == '9':
+            path = input('Enter CSV or vCard (.vcf) file to export to = ')
+            jobs.append(contact_io.Job(f'Export to {path}', contact_io.export_file, book, path))
+            print(f'Exporting to {path} in the background...')
+
         else:
-            print('Contact not found')
-            
-    elif choice == '5':
-        search_name = input('Enter contact name to search =')
-        found = False
-        for name, contact in contacts.items():
-            if search_name.lower() in name.lower(): 
-                print(f'Found - Name {name}, Age: {age}, Mobile Number: {mobile}, Email: {email}')
-                found = True
-        if not found:
-            print('No contact found with that name')
-      
-    elif choice == '6':
-        print(f'Total  contacts in your book : {len(contacts)}')
-        
-    elif choice == '7':
-        print('Good bye...Closing the program')
-        break
-    
+            print('Invalid input')
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        batch(sys.argv[2] if len(sys.argv) > 2 else '-')
     else:
-        print('Invalid input')                    
-                    
-            
-                   
-                                     
\ No newline at end of file
+        main()
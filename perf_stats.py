@@ -0,0 +1,29 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def mean_p95_max(samples):
+    ordered = sorted(samples)
+    return sum(ordered) / len(ordered), percentile(ordered, 0.95), ordered[-1]
+
+
+def max_rss_bytes():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS; None on Windows
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+
+def run_isolated(func, *args):
+    # Runs func in a fresh worker process, so max RSS belongs to this call alone
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(func, *args).result()
@@ -1,52 +1,35 @@
 from tkinter import *
+from tkinter import messagebox
+import tkinter
+from form_engine import Form
+from registration_store import REGISTRATION_FORM, BatchWriter, SQLiteStore
 root = Tk()
-root.geometry("500x300")
-
-def getvals():
-    print("Accepted")
+root.geometry("500x400")
+
+def getvals(record):
+    # Queued for the background writer; nothing here touches the database
+    writer.submit(record)
+    return "Accepted"
+
+def check_writer():
+    # Saving happens on the writer thread, so its failures are picked up here
+    error = writer.pop_error()
+    if error is not None:
+        form.show(f"{writer.failed} registration(s) could not be saved: {error}")
+    root.after(500, check_writer)
+
+def close():
+    error = writer.close()
+    if error is not None:
+        messagebox.showerror("Registration", f"{writer.failed} registration(s) could not be saved: {error}")
+    root.destroy()
 
 Label(root, text="Python Registration Form", font="arial 15 bold").grid(row=0, column=3)
 
-name = Label(root, text="Name")
-cnic = Label(root, text="Cnic")
-phone = Label(root, text="Phone")
-gender = Label(root, text="Gender")
-emergency = Label(root, text="Emergency")
-paymentmood = Label(root, text="Payment Mood")
-
-name.grid(row=1, column=2)
-cnic.grid(row=2, column=2)
-phone.grid(row=3, column=2)
-gender.grid(row=4, column=2)
-emergency.grid(row=5, column=2)
-paymentmood.grid(row=6, column=2)
-
-namevalue = StringVar
-cnicvalue = StringVar
-phonevalue = StringVar
-gendervalue = StringVar
-emergencyvalue = StringVar
-paymentmathodvalue = StringVar
-checkvalue = IntVar
-
-
-nameentry = Entry(root, textvariable=namevalue )
-cnicentry = Entry(root, textvariable=cnicvalue)
-phoneentry = Entry(root, textvariable=phonevalue)
-genderentry = Entry(root, textvariable=gendervalue)
-emergencyentry = Entry(root, textvariable=emergencyvalue)
-paymentmathodentry = Entry(root, textvariable=paymentmathodvalue)
-
-nameentry.grid(row=1, column=3)
-cnicentry.grid(row=2, column=3)
-phoneentry.grid(row=3, column=3)
-genderentry.grid(row=4, column=3)
-emergencyentry.grid(row=5, column=3)
-paymentmathodentry.grid(row=6, column=3)
-
-checkbtn = Checkbutton(text="remember to me!", variable=checkvalue)
-checkbtn.grid(row=7, column=3)
+form = Form(root, REGISTRATION_FORM, getvals, row=1, column=2, widgets=tkinter)
 
-Button(text="Submit", command=getvals).grid(row=8, column=3)
+writer = BatchWriter(SQLiteStore())
+root.protocol("WM_DELETE_WINDOW", close)
+check_writer()
 
-root.mainloop()
\ No newline at end of file
+root.mainloop()
@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import random
+import string
+import tempfile
+import time
+
+from perf_stats import percentile
+from registration_store import BatchWriter, SQLiteStore, validate
+
+
+def random_record(rng):
+    return {
+        'name': ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12))).title(),
+        'cnic': f'{rng.randrange(10 ** 5):05d}-{rng.randrange(10 ** 7):07d}-{rng.randrange(10)}',
+        'phone': f'03{rng.randrange(100):02d}-{rng.randrange(10 ** 7):07d}',
+        'gender': rng.choice(['Male', 'Female']),
+        'emergency': f'03{rng.randrange(10 ** 9):09d}',
+        'payment_method': rng.choice(['Cash', 'Card', 'Bank transfer']),
+        'remember': rng.randint(0, 1),
+    }
+
+
+def bursts(seed, count, size):
+    # Burst sizes vary around the mean so the writer sees lulls and spikes
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield [random_record(rng) for _ in range(rng.randint(1, 2 * size))]
+
+
+def summarize(latencies, records, elapsed):
+    latencies = sorted(latencies)
+    return {
+        'records': records,
+        'records_per_sec': records / elapsed,
+        'submit_p50_us': percentile(latencies, 0.50) * 1e6,
+        'submit_p99_us': percentile(latencies, 0.99) * 1e6,
+        'submit_max_us': latencies[-1] * 1e6,
+    }
+
+
+def run(submit, finish, workload, gap):
+    # Times each submit as the form's button would see it, then the time
+    # until everything is stored
+    clock = time.perf_counter
+    latencies = []
+    records = 0
+    start = clock()
+    for burst in workload:
+        for record in burst:
+            before = clock()
+            if not validate(record):
+                submit(record)
+            latencies.append(clock() - before)
+        records += len(burst)
+        time.sleep(gap)
+    finish()
+    return summarize(latencies, records, clock() - start)
+
+
+def batched(path, workload, gap, batch_size):
+    writer = BatchWriter(SQLiteStore(path), batch_size=batch_size)
+    result = run(writer.submit, writer.close, workload, gap)
+    result['batches'] = writer.batches
+    return result
+
+
+def row_by_row(path, workload, gap):
+    # The straightforward alternative: insert and commit inside submit
+    store = SQLiteStore(path)
+    return run(lambda record: store.insert_many([record]), store.close, workload, gap)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Registration form persistence benchmark')
+    parser.add_argument('--bursts', type=int, default=50)
+    parser.add_argument('--burst-size', type=int, default=200, help='mean submissions per burst')
+    parser.add_argument('--gap-ms', type=float, default=20, help='pause between bursts')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='registration_benchmark.json')
+    args = parser.parse_args()
+
+    workload = list(bursts(args.seed, args.bursts, args.burst_size))
+    gap = args.gap_ms / 1000
+    with tempfile.TemporaryDirectory() as directory:
+        report = {
+            'seed': args.seed,
+            'bursts': args.bursts,
+            'burst_size': args.burst_size,
+            'gap_ms': args.gap_ms,
+            'batched': batched(os.path.join(directory, 'batched.db'), workload, gap, args.batch_size),
+            'row_by_row': row_by_row(os.path.join(directory, 'rows.db'), workload, gap),
+        }
+
+    for mode in ('batched', 'row_by_row'):
+        result = report[mode]
+        print(f"{mode:<11} {result['records_per_sec']:>10.0f} records/s  "
+              f"submit p50 {result['submit_p50_us']:>8.1f}us  p99 {result['submit_p99_us']:>8.1f}us")
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+    print(f'Results written to {args.output}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import queue
+import re
+import sqlite3
+import threading
+import time
+
+from form_engine import Field, check_record
+
+CNIC_PATTERN = re.compile(r'\d{5}-?\d{7}-?\d')
+PHONE_PATTERN = re.compile(r'(?:\+92|0)3\d{2}-?\d{7}')
+REGISTRATION_FORM = [
+    Field('name', 'Name', required=True),
+    Field('cnic', 'Cnic', required=True, pattern=CNIC_PATTERN, message='Cnic must look like 12345-1234567-1'),
+    Field('phone', 'Phone', required=True, pattern=PHONE_PATTERN, message='Phone must look like 0300-1234567'),
+    Field('gender', 'Gender'),
+    Field('emergency', 'Emergency'),
+    Field('payment_method', 'Payment Mood'),
+    Field('remember', 'remember to me!', kind='check'),
+]
+FIELDS = [field.name for field in REGISTRATION_FORM]
+STOP = object()
+
+
+def validate(record):
+    return check_record(REGISTRATION_FORM, record)[1]
+
+
+class SQLiteStore:
+
+    # The writer only needs insert_many(records) and close(), so any other
+    # backend with those two methods can replace this one
+    def __init__(self, path='registrations.db'):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS registrations '
+            '(id INTEGER PRIMARY KEY, name TEXT, cnic TEXT, phone TEXT, gender TEXT, '
+            'emergency TEXT, payment_method TEXT, remember INTEGER)'
+        )
+        self.connection.commit()
+
+    def insert_many(self, records):
+        # One transaction per batch
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO registrations ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))})",
+                [[record[field] for field in FIELDS] for record in records],
+            )
+
+    def count(self):
+        return self.connection.execute('SELECT COUNT(*) FROM registrations').fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+
+class BatchWriter(threading.Thread):
+
+    # submit() only queues the record, so the form never waits on the store.
+    # The thread takes whatever has queued up, waiting at most flush_interval
+    # for a batch to fill, and writes it with a single insert_many call.
+    def __init__(self, store, batch_size=500, flush_interval=0.05):
+        super().__init__(daemon=True)
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self.error = None
+        self.lock = threading.Lock()
+        self.start()
+
+    def submit(self, record):
+        self.queue.put(record)
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not STOP:
+                try:
+                    batch.append(self.queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch[-1] is STOP:
+                batch.pop()
+                stopping = True
+            if batch:
+                self.write(batch)
+        try:
+            self.store.close()
+        except Exception as e:
+            self.record_error(e, 0)
+
+    def write(self, batch):
+        # A failed batch is counted and reported, and the thread carries on
+        # with the next one; any backend error is caught, not just sqlite's
+        try:
+            self.store.insert_many(batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.record_error(e, len(batch))
+
+    def record_error(self, error, records):
+        with self.lock:
+            self.failed += records
+            self.error = error
+
+    def pop_error(self):
+        # The latest error not yet reported, or None
+        with self.lock:
+            error, self.error = self.error, None
+        return error
+
+    def close(self):
+        # Writes out everything submitted so far, closes the store and
+        # returns the error that was not yet reported, if any
+        self.queue.put(STOP)
+        self.join()
+        return self.pop_error()
@@ -0,0 +1,243 @@
+import argparse
+import heapq
+import time
+from collections import deque
+
+from perf_stats import mean_p95_max
+
+DIRECTIONS = ['up', 'down', 'left', 'right']
+
+
+def hamiltonian_cycle(columns, rows):
+    # Snake through columns 1.. row by row, then return up column 0. That
+    # closes only over an even number of rows, so transpose when just the
+    # columns are even. An odd x odd board has no cycle through every cell
+    # (it would need as many black squares as white), so there the last row
+    # is left off and Autopilot does not rely on the cycle for food in it.
+    if rows % 2 and columns % 2 == 0:
+        return {row * columns + column: next_row * columns + next_column
+                for (row, column), (next_row, next_column) in _serpentine(rows, columns).items()}
+    height = rows if rows % 2 == 0 else rows - 1
+    return {row * columns + column: next_row * columns + next_column
+            for (column, row), (next_column, next_row) in _serpentine(columns, height).items()}
+
+
+def _serpentine(width, height):
+    order = []
+    for row in range(height):
+        cells = range(1, width) if row % 2 == 0 else range(width - 1, 0, -1)
+        order += [(column, row) for column in cells]
+    order += [(0, row) for row in range(height - 1, -1, -1)]
+    return {cell: order[(i + 1) % len(order)] for i, cell in enumerate(order)}
+
+
+class Autopilot:
+
+    # Works in board cell indices (row * columns + column). A cell covered by
+    # body part j of n is free again after n - j ticks, so planning treats the
+    # body as obstacles that clear as the snake moves.
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+        self.cycle = hamiltonian_cycle(columns, rows)
+        self.path = deque()
+        self.path_food = None
+        self.stall_limit = columns * rows
+        self.length = 0
+        self.since_food = 0
+        self.stalls = 0
+        self.plan_times = []
+        self.planned = 0
+        self.reused = 0
+
+    def neighbours(self, cell):
+        row, column = divmod(cell, self.columns)
+        if row > 0:
+            yield cell - self.columns
+        if row < self.rows - 1:
+            yield cell + self.columns
+        if column > 0:
+            yield cell - 1
+        if column < self.columns - 1:
+            yield cell + 1
+
+    def direction_to(self, head, cell):
+        if cell == head - self.columns:
+            return 'up'
+        elif cell == head + self.columns:
+            return 'down'
+        elif cell == head - 1:
+            return 'left'
+        return 'right'
+
+    def distance(self, a, b):
+        return abs(a // self.columns - b // self.columns) + abs(a % self.columns - b % self.columns)
+
+    def next_direction(self, snake, food, direction):
+        started = time.perf_counter()
+        board = snake.board
+        body = [board.cell(x, y) for x, y in snake.coordinates]
+        head = body[0]
+        target = board.cell(*food.coordinates)
+        free_at = {}
+        for j, cell in enumerate(body):
+            free_at[cell] = max(free_at.get(cell, 0), len(body) - j)
+
+        # No growth for a whole board's worth of ticks means the safe moves
+        # are going round in circles; from then on a food path is taken when
+        # it leaves room for the body, even if the tail is cut off
+        if len(body) != self.length:
+            self.length = len(body)
+            self.since_food = 0
+        else:
+            self.since_food += 1
+            if self.since_food == self.stall_limit:
+                self.stalls += 1
+        stalled = self.since_food >= self.stall_limit
+
+        step = (self.follow_path(head, target, free_at)
+                or self.plan_path(head, target, body, free_at, stalled)
+                or self.fallback(head, target, body, free_at, stalled))
+
+        self.plan_times.append(time.perf_counter() - started)
+        return self.direction_to(head, step) if step is not None else direction
+
+    def follow_path(self, head, target, free_at):
+        # The cached path stays good while the food is where it was planned
+        # for and the snake is still on it
+        if self.path and self.path_food == target:
+            step = self.path[0]
+            if self.distance(head, step) == 1 and free_at.get(step, 0) <= 1:
+                self.reused += 1
+                return self.path.popleft()
+        self.path.clear()
+        return None
+
+    def plan_path(self, head, target, body, free_at, stalled):
+        path = self.astar(head, target, free_at)
+        if path and (self.tail_reachable(path, body, grow=True)
+                     or stalled and self.room_after(path, body) > len(body)):
+            self.planned += 1
+            self.path = deque(path[1:])
+            self.path_food = target
+            return path[0]
+        return None
+
+    def fallback(self, head, target, body, free_at, stalled):
+        # Ride the Hamiltonian cycle while it passes the food, else take the
+        # longest safe path: of the moves that keep the tail in reach, the
+        # one farthest from the tail, which stretches the body out and keeps
+        # reshaping the board until a path to the food opens up. With no
+        # safe move, take the one that leaves the most room.
+        moves = [cell for cell in self.neighbours(head) if free_at.get(cell, 0) <= 1]
+        step = self.cycle.get(head)
+        if (target in self.cycle and not stalled and step in moves
+                and self.tail_reachable([step], body, grow=step == target)):
+            return step
+        safe = [cell for cell in moves if self.tail_reachable([cell], body, grow=cell == target)]
+        if safe:
+            tail = body[-1]
+            return max(safe, key=lambda cell: (self.distance(cell, tail), -self.distance(cell, target)))
+        return max(moves, key=lambda cell: self.room(cell, free_at), default=None)
+
+    def astar(self, start, goal, free_at):
+        # Returns the cells after start up to goal, or None
+        frontier = [(self.distance(start, goal), 0, start)]
+        came_from = {start: None}
+        cost = {start: 0}
+        while frontier:
+            _, steps, cell = heapq.heappop(frontier)
+            if cell == goal and cell != start:
+                path = []
+                while cell != start:
+                    path.append(cell)
+                    cell = came_from[cell]
+                return path[::-1]
+            if steps > cost[cell]:
+                continue
+            for neighbour in self.neighbours(cell):
+                arrival = steps + 1
+                if arrival < free_at.get(neighbour, 0) or arrival >= cost.get(neighbour, arrival + 1):
+                    continue
+                cost[neighbour] = arrival
+                came_from[neighbour] = cell
+                heapq.heappush(frontier, (arrival + self.distance(neighbour, goal), arrival, neighbour))
+        return None
+
+    def tail_reachable(self, path, body, grow):
+        # Play the path forward and check the head can still get to the tail,
+        # so eating never seals the snake into a pocket
+        length = len(body) + grow
+        moved = (path[::-1] + body)[:length]
+        head, tail = moved[0], moved[-1]
+        blocked = set(moved[:-1])
+        seen = {head}
+        queue = deque([head])
+        while queue:
+            cell = queue.popleft()
+            for neighbour in self.neighbours(cell):
+                if neighbour == tail:
+                    return True
+                if neighbour not in seen and neighbour not in blocked:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return False
+
+    def room_after(self, path, body):
+        # Free cells the head can still reach once the path is eaten
+        moved = (path[::-1] + body)[:len(body) + 1]
+        blocked = set(moved)
+        seen = {moved[0]}
+        queue = deque(seen)
+        while queue:
+            cell = queue.popleft()
+            for neighbour in self.neighbours(cell):
+                if neighbour not in seen and neighbour not in blocked:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return len(seen) - 1
+
+    def room(self, start, free_at):
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for neighbour in self.neighbours(cell):
+                if neighbour not in seen and free_at.get(neighbour, 0) <= 1:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return len(seen)
+
+    def summary(self):
+        if not self.plan_times:
+            return "autopilot: no ticks planned"
+        mean, p95, worst = mean_p95_max(self.plan_times)
+        return (f"autopilot planning: mean {mean * 1000:.3f}ms, p95 {p95 * 1000:.3f}ms, "
+                f"max {worst * 1000:.3f}ms over {len(self.plan_times)} ticks; "
+                f"{self.planned} paths planned, {self.reused} ticks reused a cached path, "
+                f"{self.stalls} stalls broken")
+
+
+def main():
+    from snake_sim import Game
+
+    parser = argparse.ArgumentParser(description="Play headless snake games on autopilot")
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--max-steps", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for seed in range(args.seed, args.seed + args.games):
+        game = Game(seed)
+        board = game.snake.board
+        pilot = Autopilot(board.columns, board.rows)
+        for steps in range(1, args.max_steps + 1):
+            _, finished = game.step(pilot.next_direction(game.snake, game.food, game.direction))
+            if finished:
+                break
+        print(f"game {seed}: score {game.score} in {steps} steps")
+        print(f"  {pilot.summary()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import argparse
+import random
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from app import BODY_PARTS, GAME_HEIGHT, GAME_WIDTH, SPACE_SIZE, SPEED, Food, Snake, advance, turn
+from perf_stats import mean_p95_max
+
+DIRECTIONS = ['up', 'down', 'left', 'right']
+OPPOSITE = [1, 0, 3, 2]  # index of the reverse of each direction above
+ROW_STEP = [-1, 1, 0, 0]
+COLUMN_STEP = [0, 0, -1, 1]
+
+
+class Game:
+
+    # One headless game on exactly the Snake/Food/advance rules of app.py
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.snake = Snake(rng=self.rng)
+        self.food = Food(self.snake.board)
+        self.direction = 'down'
+        self.score = 0
+        self.finished = False
+
+    def step(self, new_direction=None):
+        if new_direction is not None:
+            self.direction = turn(self.direction, new_direction)
+        ate, self.finished = advance(self.snake, self.food, self.direction)
+        self.score += ate
+        return ate, self.finished
+
+
+class BatchGame:
+
+    # Many boards advanced together with array operations. Each board cell
+    # holds how many more ticks the body covers it: the head gets the snake
+    # length and every tick counts the whole grid down by one (skipped on a
+    # tick that eats), so the tail frees itself without a body list. The rules
+    # match advance(), including the three parts stacked on the start cell.
+    def __init__(self, boards, seed=None):
+        if np is None:
+            raise ImportError("BatchGame needs NumPy")
+        self.boards = boards
+        self.rows = GAME_HEIGHT // SPACE_SIZE
+        self.columns = GAME_WIDTH // SPACE_SIZE
+        self.cells = self.rows * self.columns
+        self.rng = np.random.default_rng(seed)
+        self.index = np.arange(boards)
+        self.opposite = np.array(OPPOSITE)
+        self.row_step = np.array(ROW_STEP)
+        self.column_step = np.array(COLUMN_STEP)
+
+        self.ttl = np.zeros((boards, self.cells), dtype=np.int32)
+        self.head = np.zeros(boards, dtype=np.int64)
+        self.length = np.zeros(boards, dtype=np.int32)
+        self.direction = np.zeros(boards, dtype=np.int64)
+        self.food = np.zeros(boards, dtype=np.int64)
+        self.score = np.zeros(boards, dtype=np.int32)
+        self.completed = []  # final scores of finished games
+        self.reset(self.index)
+
+    def reset(self, boards):
+        self.ttl[boards] = 0
+        self.ttl[boards, 0] = BODY_PARTS
+        self.head[boards] = 0
+        self.length[boards] = BODY_PARTS
+        self.direction[boards] = DIRECTIONS.index('down')
+        self.score[boards] = 0
+        self.place_food(boards)
+
+    def place_food(self, boards):
+        # A random empty cell per board: highest random key among free cells
+        if len(boards):
+            keys = self.rng.random((len(boards), self.cells))
+            keys[self.ttl[boards] > 0] = -1
+            self.food[boards] = keys.argmax(axis=1)
+
+    def step(self, actions=None):
+        # actions: one direction index per board, or None to keep going
+        if actions is not None:
+            actions = np.asarray(actions)
+            self.direction = np.where(self.opposite[actions] == self.direction, self.direction, actions)
+
+        row = self.head // self.columns + self.row_step[self.direction]
+        column = self.head % self.columns + self.column_step[self.direction]
+        wall = (row < 0) | (row >= self.rows) | (column < 0) | (column >= self.columns)
+        head = np.where(wall, 0, row * self.columns + column)
+        ate = ~wall & (head == self.food)
+
+        self.ttl -= (self.ttl > 0) & ~ate[:, None]
+        bitten = ~wall & (self.ttl[self.index, head] > 0)
+        self.length += ate
+        self.score += ate
+        done = wall | bitten | (self.length == self.cells)
+
+        alive = np.flatnonzero(~done)
+        self.ttl[alive, head[alive]] = self.length[alive]
+        self.head[alive] = head[alive]
+        self.place_food(np.flatnonzero(ate & ~done))
+
+        finished = np.flatnonzero(done)
+        if len(finished):
+            self.completed.extend(self.score[finished].tolist())
+            self.reset(finished)
+        return ate, done
+
+
+def benchmark_game(steps, seed):
+    rng = random.Random(seed)
+    game = Game(seed)
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, finished = game.step(rng.choice(DIRECTIONS))
+        if finished:
+            game.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def benchmark_batch(boards, steps, seed):
+    game = BatchGame(boards, seed)
+    rng = np.random.default_rng(seed)
+    start = time.perf_counter()
+    for _ in range(steps):
+        game.step(rng.integers(0, 4, boards))
+    return boards * steps / (time.perf_counter() - start)
+
+
+def benchmark_tk(steps, seed, pooled=True):
+    # The rendered loop without the SPEED delay, timed per step; needs a
+    # display. The same seed gives both renderers the same moves
+    from tkinter import Canvas, TclError, Tk
+    try:
+        window = Tk()
+    except TclError:
+        return None
+    canvas = Canvas(window, height=GAME_HEIGHT, width=GAME_WIDTH)
+    canvas.pack()
+    rng = random.Random(seed)
+    snake = Snake(canvas, rng, pooled)
+    food = Food(snake.board, canvas, pooled)
+    direction = 'down'
+    clock = time.perf_counter
+    times = []
+    for _ in range(steps):
+        started = clock()
+        direction = turn(direction, rng.choice(DIRECTIONS))
+        _, finished = advance(snake, food, direction)
+        if finished:
+            canvas.delete("all")
+            snake = Snake(canvas, rng, pooled)
+            food = Food(snake.board, canvas, pooled)
+        window.update()
+        times.append(clock() - started)
+    window.destroy()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless snake simulator benchmark")
+    parser.add_argument("--steps", type=int, default=20000)
+    parser.add_argument("--boards", type=int, default=4096)
+    parser.add_argument("--batch-steps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"Tk loop (SPEED={SPEED}ms): {1000 / SPEED:.1f} steps/s by design")
+    for render, pooled in (("pooled", True), ("legacy", False)):
+        times = benchmark_tk(min(args.steps, 2000), args.seed, pooled)
+        if times is None:
+            print("Tk loop unthrottled: no display available")
+            break
+        mean, p95, worst = mean_p95_max(times)
+        print(f"Tk loop unthrottled, {render} rendering: {1 / mean:.0f} steps/s, "
+              f"p95 {p95 * 1000:.2f}ms, max {worst * 1000:.2f}ms")
+    print(f"Headless Game: {benchmark_game(args.steps, args.seed):.0f} steps/s")
+    if np is None:
+        print("BatchGame: NumPy not installed")
+    else:
+        print(f"BatchGame x{args.boards}: {benchmark_batch(args.boards, args.batch_steps, args.seed):.0f} board-steps/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,77 @@
+import argparse
 import tkinter as tk
 from tkinter import messagebox
+from tictactoe_engine import Board, Engine
+
+BOARD_PIXELS = 600
+
+def check_winner(line):
+    global winner
+    if line:
+        winner = True
+        for i in line:
+            row, column = divmod(i, board.size)
+            canvas.tag_lower(canvas.create_rectangle(column * cell, row * cell, (column + 1) * cell, (row + 1) * cell, fill="green", outline=""))
+        messagebox.showinfo("Tic-Tac-Toe", f"Player {current_player} wins!")
+        root.quit()
+    elif board.full():
+        winner = True
+        messagebox.showinfo("Tic-Tac-Toe", "It's a draw!")
+        root.quit()
+
+def play(index):
+    # Only the new mark is drawn; the rest of the canvas is left alone
+    line = board.place(index, current_player)
+    row, column = divmod(index, board.size)
+    canvas.create_text((column + 0.5) * cell, (row + 0.5) * cell, text=current_player, font=("normal", max(6, cell // 2)))
+    check_winner(line)
+    toggle_player()
 
-def check_winner():
-    for combo in [[0,1,2], [3,4,5], [6,7,8], [0,3,6], [1,4,7], [2,5,8], [0,4,8], [2,4,6]]:
-        if buttons[combo[0]]["text"] == buttons[combo[1]]["text"] == buttons[combo[2]]["text"] !="":
-            buttons[combo[0]].config(bg="green")
-            buttons[combo[1]].config(bg="green")
-            buttons[combo[2]].config(bg="green")
-            messagebox.showinfo("Tic-Tac-Toe", f"Player {buttons[combo[0]]['text']} wins!")
-            root.quit()
-            
 def button_click(index):
-    if buttons[index]["text"] == "" and not winner:
-        buttons[index]["text"] = current_player
-        check_winner()
-        toggle_player()
-        
+    if board.cells[index] == "" and not winner:
+        play(index)
+        if single_player.get() and not winner:
+            other = "X" if current_player == "O" else "O"
+            play(engine.best_move(board.bits[current_player], board.bits[other]))
+
+def canvas_click(event):
+    column, row = event.x // cell, event.y // cell
+    if 0 <= row < board.size and 0 <= column < board.size:
+        button_click(row * board.size + column)
+
 def toggle_player():
     global current_player
-    current_player = "X" if current_player == "O" else "O" 
+    current_player = "X" if current_player == "O" else "O"
     label.config(text=f"Player {current_player}'s turn")
-    
+
+parser = argparse.ArgumentParser(description="Tic-Tac-Toe on an N x N board, K in a row to win")
+parser.add_argument("--size", type=int, default=3, help="board is SIZE x SIZE (up to 50)")
+parser.add_argument("--k", type=int, default=3, help="stones in a row needed to win")
+args = parser.parse_args()
+if not 3 <= args.size <= 50 or not 3 <= args.k <= args.size:
+    parser.error("need 3 <= SIZE <= 50 and 3 <= K <= SIZE")
+
 root = tk.Tk()
 root.title("Tic-Tac-Toe")
 
-buttons = [tk.Button(root, text="", font=("normal", 25), width=6, height=2, command=lambda i=i: button_click(i)) for i in range(9)]
+# One canvas with a line per grid row/column instead of a widget per cell
+board = Board(args.size, args.k)
+cell = BOARD_PIXELS // board.size
+canvas = tk.Canvas(root, width=cell * board.size, height=cell * board.size, bg="white", highlightthickness=0)
+canvas.grid(row=0, column=0)
+for i in range(1, board.size):
+    canvas.create_line(i * cell, 0, i * cell, cell * board.size)
+    canvas.create_line(0, i * cell, cell * board.size, i * cell)
+canvas.bind("<Button-1>", canvas_click)
 
-for i, button in enumerate(buttons):
-    button.grid(row=i //3, column=i % 3)
-    
 current_player = "X"
 winner = False
+engine = Engine()
+single_player = tk.BooleanVar(value=False)
 label = tk.Label(root, text=f"Player {current_player}'s turn", font=("normal", 16))
-label.grid(row=3, column=0, columnspan=3)
+label.grid(row=1, column=0)
+# The engine solves the classic game only
+tk.Checkbutton(root, text="Play against the computer", variable=single_player,
+               state=tk.NORMAL if board.size == board.k == 3 else tk.DISABLED).grid(row=2, column=0)
 
-root.mainloop()                       
-    
\ No newline at end of file
+root.mainloop()
@@ -0,0 +1,172 @@
+import time
+
+# Cells are numbered 0-8 row by row; a player's stones are the set bits of
+# one int, so a line is complete when all three bits of its mask are set.
+COMBOS = [[0, 1, 2], [3, 4, 5], [6, 7, 8], [0, 3, 6], [1, 4, 7], [2, 5, 8], [0, 4, 8], [2, 4, 6]]
+WIN_MASKS = [sum(1 << i for i in combo) for combo in COMBOS]
+FULL = (1 << 9) - 1
+MOVE_ORDER = [4, 0, 2, 6, 8, 1, 3, 5, 7]  # centre, corners, edges
+INFINITY = 100
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+def _symmetries():
+    # The four rotations of the grid and their mirror images, as the old
+    # cell each new cell is read from
+    rotate = [6, 3, 0, 7, 4, 1, 8, 5, 2]
+    mirror = [2, 1, 0, 5, 4, 3, 8, 7, 6]
+    perms = []
+    perm = list(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append([perm[m] for m in mirror])
+        perm = [perm[r] for r in rotate]
+    return perms
+
+
+def _transform(bits, perm):
+    return sum(1 << i for i, cell in enumerate(perm) if bits >> cell & 1)
+
+
+# SYMMETRY_TABLES[s][bits] is bitboard `bits` under symmetry s
+SYMMETRY_TABLES = [[_transform(bits, perm) for bits in range(1 << 9)] for perm in _symmetries()]
+
+
+def winning_line(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return mask
+    return 0
+
+
+def canonical(mine, theirs):
+    # The same key for all eight rotations/reflections of a position
+    return min(table[mine] | table[theirs] << 9 for table in SYMMETRY_TABLES)
+
+
+class Board:
+
+    # An N x N grid for K in a row. A move can only complete a line through
+    # its own cell, so placing a stone counts the runs along those four
+    # lines instead of rescanning the board. Each player's stones are also
+    # kept as a bitboard, which on 3 x 3 is what Engine searches.
+    DIRECTIONS = [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+    def __init__(self, size=3, k=3):
+        self.size = size
+        self.k = k
+        self.cells = [""] * (size * size)
+        self.bits = {"X": 0, "O": 0}
+        self.moves = 0
+
+    def place(self, index, player):
+        # Returns the cells of the line this move completed, or None
+        self.cells[index] = player
+        self.bits[player] |= 1 << index
+        self.moves += 1
+        return self.line_through(index)
+
+    def undo(self, index):
+        self.bits[self.cells[index]] &= ~(1 << index)
+        self.cells[index] = ""
+        self.moves -= 1
+
+    def line_through(self, index):
+        player = self.cells[index]
+        size = self.size
+        row, column = divmod(index, size)
+        for row_step, column_step in self.DIRECTIONS:
+            run = [index]
+            for sign in (1, -1):
+                r, c = row + sign * row_step, column + sign * column_step
+                while 0 <= r < size and 0 <= c < size and self.cells[r * size + c] == player:
+                    run.append(r * size + c)
+                    r += sign * row_step
+                    c += sign * column_step
+            if len(run) >= self.k:
+                return sorted(run)
+        return None
+
+    def full(self):
+        return self.moves == len(self.cells)
+
+    def empty_cells(self):
+        return [i for i, cell in enumerate(self.cells) if not cell]
+
+
+class Engine:
+
+    # Negamax with alpha-beta over (side to move, other side) bitboards.
+    # Scores are from the side to move: a win is worth one more than the
+    # number of empty cells left, so quicker wins and slower losses rank
+    # higher, and 0 is a draw.
+    def __init__(self):
+        self.table = {}
+        self.nodes = 0
+
+    def negamax(self, mine, theirs, alpha=-INFINITY, beta=INFINITY):
+        self.nodes += 1
+        taken = mine | theirs
+        if winning_line(theirs):
+            return -(10 - bin(taken).count("1"))
+        if taken == FULL:
+            return 0
+
+        key = canonical(mine, theirs)
+        entry = self.table.get(key)
+        if entry is not None:
+            value, bound = entry
+            if bound == EXACT:
+                return value
+            elif bound == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha = alpha
+        best = -INFINITY
+        for cell in MOVE_ORDER:
+            bit = 1 << cell
+            if taken & bit:
+                continue
+            value = -self.negamax(theirs, mine | bit, -beta, -alpha)
+            if value > best:
+                best = value
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+
+        if best <= original_alpha:
+            bound = UPPER
+        elif best >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table[key] = (best, bound)
+        return best
+
+    def best_move(self, mine, theirs):
+        # The cell the side to move should take, or None on a finished board
+        taken = mine | theirs
+        if taken == FULL or winning_line(mine) or winning_line(theirs):
+            return None
+        best, best_cell = -INFINITY - 1, None
+        for cell in MOVE_ORDER:
+            bit = 1 << cell
+            if taken & bit:
+                continue
+            value = -self.negamax(theirs, mine | bit, -INFINITY, -best)
+            if value > best:
+                best, best_cell = value, cell
+        return best_cell
+
+
+if __name__ == "__main__":
+    engine = Engine()
+    start = time.perf_counter()
+    value = engine.negamax(0, 0)
+    print(f"Empty board value {value} (0 is a draw): {engine.nodes} nodes, "
+          f"{len(engine.table)} positions stored, {(time.perf_counter() - start) * 1000:.1f}ms")
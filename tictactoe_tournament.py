@@ -0,0 +1,255 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from perf_stats import percentile
+from tictactoe_engine import Board, Engine
+
+OTHER = {"X": "O", "O": "X"}
+RESERVOIR_SIZE = 10000
+
+
+class RandomPlayer:
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.nodes = 0
+
+    def move(self, board, player):
+        self.nodes += 1
+        return self.rng.choice(board.empty_cells())
+
+
+class GreedyPlayer:
+
+    # Wins if it can, blocks if it must, else takes the free cell nearest
+    # the centre
+    def __init__(self, rng):
+        self.rng = rng
+        self.nodes = 0
+
+    def move(self, board, player):
+        empty = board.empty_cells()
+        for who in (player, OTHER[player]):
+            for index in empty:
+                self.nodes += 1
+                line = board.place(index, who)
+                board.undo(index)
+                if line:
+                    return index
+        centre = (board.size - 1) / 2
+        return min(empty, key=lambda i: (abs(i // board.size - centre) + abs(i % board.size - centre), self.rng.random()))
+
+
+class MinimaxPlayer:
+
+    # Perfect play from Engine; its transposition table lives as long as the
+    # worker's player, so later games are mostly table hits
+    def __init__(self, rng):
+        self.engine = Engine()
+        self.nodes = 0
+
+    def move(self, board, player):
+        before = self.engine.nodes
+        index = self.engine.best_move(board.bits[player], board.bits[OTHER[player]])
+        self.nodes += self.engine.nodes - before
+        return index
+
+
+class MonteCarloPlayer:
+
+    # Scores each free cell by random playouts: 2 for a win, 1 for a draw
+    def __init__(self, rng, playouts=20):
+        self.rng = rng
+        self.playouts = playouts
+        self.nodes = 0
+
+    def move(self, board, player):
+        best, best_score = None, -1
+        for index in board.empty_cells():
+            score = sum(self.playout(board, index, player) for _ in range(self.playouts))
+            if score > best_score:
+                best, best_score = index, score
+        return best
+
+    def playout(self, board, index, player):
+        placed = [index]
+        self.nodes += 1
+        winner = player if board.place(index, player) else None
+        if winner is None:
+            mover = OTHER[player]
+            empty = board.empty_cells()
+            self.rng.shuffle(empty)
+            for cell in empty:
+                placed.append(cell)
+                self.nodes += 1
+                if board.place(cell, mover):
+                    winner = mover
+                    break
+                mover = OTHER[mover]
+        for cell in placed:
+            board.undo(cell)
+        return 1 if winner is None else 2 if winner == player else 0
+
+
+PLAYERS = {
+    "random": RandomPlayer,
+    "greedy": GreedyPlayer,
+    "minimax": MinimaxPlayer,
+    "montecarlo": MonteCarloPlayer,
+}
+
+
+class MoveStats:
+
+    # Latencies are kept as a uniform reservoir sample so a million-game run
+    # ships a bounded list back from each worker
+    def __init__(self, rng):
+        self.rng = rng
+        self.moves = 0
+        self.nodes = 0
+        self.seconds = 0.0
+        self.latencies = []
+
+    def record(self, latency):
+        self.moves += 1
+        self.seconds += latency
+        if len(self.latencies) < RESERVOIR_SIZE:
+            self.latencies.append(latency)
+        else:
+            slot = self.rng.randrange(self.moves)
+            if slot < RESERVOIR_SIZE:
+                self.latencies[slot] = latency
+
+
+def play_game(size, k, players, stats):
+    # players and stats are keyed by "X"/"O"; X moves first
+    board = Board(size, k)
+    current_player = "X"
+    clock = time.perf_counter
+    while True:
+        start = clock()
+        index = players[current_player].move(board, current_player)
+        stats[current_player].record(clock() - start)
+        if board.place(index, current_player):
+            return current_player
+        if board.full():
+            return ""
+        current_player = OTHER[current_player]
+
+
+def run_chunk(x_name, o_name, games, seed, size, k):
+    rng = random.Random(seed)
+    players = {"X": PLAYERS[x_name](random.Random(rng.random())), "O": PLAYERS[o_name](random.Random(rng.random()))}
+    stats = {"X": MoveStats(rng), "O": MoveStats(rng)}
+    results = {"X": 0, "O": 0, "": 0}
+    for _ in range(games):
+        results[play_game(size, k, players, stats)] += 1
+    for side in stats:
+        stats[side].nodes = players[side].nodes
+    return x_name, o_name, results, stats
+
+
+def summarize(chunks):
+    # Latency samples from the chunks are pooled as they are; chunks are
+    # the same size, so each one carries about the same weight
+    pairings = {}
+    players = {}
+    for x_name, o_name, results, stats in chunks:
+        pairing = pairings.setdefault((x_name, o_name), {"X": 0, "O": 0, "": 0})
+        for outcome, count in results.items():
+            pairing[outcome] += count
+        for name, side in ((x_name, stats["X"]), (o_name, stats["O"])):
+            player = players.setdefault(name, {"moves": 0, "nodes": 0, "seconds": 0.0, "latencies": []})
+            player["moves"] += side.moves
+            player["nodes"] += side.nodes
+            player["seconds"] += side.seconds
+            player["latencies"] += side.latencies
+
+    report_pairings = []
+    for (x_name, o_name), pairing in pairings.items():
+        games = sum(pairing.values())
+        report_pairings.append({
+            "x": x_name,
+            "o": o_name,
+            "games": games,
+            "x_win_rate": pairing["X"] / games,
+            "o_win_rate": pairing["O"] / games,
+            "draw_rate": pairing[""] / games,
+        })
+
+    report_players = {}
+    for name, player in players.items():
+        latencies = sorted(player["latencies"])
+        seconds = player["seconds"]
+        report_players[name] = {
+            "moves": player["moves"],
+            "nodes": player["nodes"],
+            "nodes_per_sec": player["nodes"] / seconds if seconds else None,
+            "p50_us": percentile(latencies, 0.50) * 1e6,
+            "p90_us": percentile(latencies, 0.90) * 1e6,
+            "p99_us": percentile(latencies, 0.99) * 1e6,
+            "max_us": latencies[-1] * 1e6,
+        }
+    return report_pairings, report_players
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless tic-tac-toe self-play tournament")
+    parser.add_argument("--players", default=",".join(PLAYERS), help="comma separated, from " + ", ".join(PLAYERS))
+    parser.add_argument("--games", type=int, default=10000, help="games per ordered pairing")
+    parser.add_argument("--chunk", type=int, default=2000, help="games per worker task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="tictactoe_tournament.json")
+    args = parser.parse_args()
+
+    names = args.players.split(",")
+    unknown = [name for name in names if name not in PLAYERS]
+    if unknown:
+        parser.error(f"unknown players: {', '.join(unknown)}")
+    if "minimax" in names and not args.size == args.k == 3:
+        parser.error("minimax only plays the 3 x 3 game")
+
+    tasks = []
+    for x_name, o_name in itertools.product(names, repeat=2):
+        for start in range(0, args.games, args.chunk):
+            tasks.append((x_name, o_name, min(args.chunk, args.games - start), args.seed + len(tasks), args.size, args.k))
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        chunks = list(pool.map(run_chunk, *zip(*tasks)))
+    elapsed = time.perf_counter() - started
+    pairings, players = summarize(chunks)
+
+    total = sum(pairing["games"] for pairing in pairings)
+    report = {
+        "seed": args.seed,
+        "size": args.size,
+        "k": args.k,
+        "games": total,
+        "games_per_sec": total / elapsed,
+        "pairings": pairings,
+        "players": players,
+    }
+    for pairing in pairings:
+        print(f"{pairing['x']:>10} vs {pairing['o']:<10} X {pairing['x_win_rate']:6.1%}  "
+              f"O {pairing['o_win_rate']:6.1%}  draw {pairing['draw_rate']:6.1%}")
+    for name, player in players.items():
+        print(f"{name:>10}: {player['nodes_per_sec']:>12.0f} nodes/s  "
+              f"p50 {player['p50_us']:>8.1f}us  p99 {player['p99_us']:>8.1f}us")
+    print(f"{total} games in {elapsed:.1f}s")
+
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from collections import defaultdict
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import mysql.connector
+from form_engine import Field, Form
 
 class UniversityTimetableGenerator:
     def __init__(self):
@@ -172,6 +173,38 @@ class UniversityTimetableGenerator:
         result += tabulate(table_data, headers=header, tablefmt="grid")
         return result
 
+COURSE_FORM = [
+    Field("code", "Course Code:", required=True),
+    Field("name", "Course Name:", required=True),
+    Field("credits", "Credits:", kind="int", required=True),
+    Field("lecture_hours", "Lecture Hours:", kind="int", required=True),
+    Field("lab_hours", "Lab Hours:", kind="int", default="0", required=True),
+]
+FACULTY_FORM = [
+    Field("faculty_id", "Faculty ID:", required=True),
+    Field("name", "Faculty Name:", required=True),
+]
+PROGRAM_FORM = [
+    Field("program_id", "Program ID:", required=True),
+    Field("name", "Program Name:", required=True),
+    Field("semesters", "Semesters:", kind="list", item=int, default="1,2,3,4,5,6,7,8", required=True),
+]
+ROOM_FORM = [
+    Field("room_id", "Room ID:", required=True),
+    Field("capacity", "Capacity:", kind="int", required=True),
+    Field("room_type", "Room Type:", kind="choice", choices=["lecture", "lab"], default="lecture"),
+]
+TIMESLOT_FORM = [
+    Field("days", "Days (comma separated):", kind="list", default="Monday,Tuesday,Wednesday,Thursday,Friday", required=True),
+    Field("start_times", "Start Times (comma separated):", kind="list", default="09:00,11:00,14:00,16:00", required=True),
+    Field("duration", "Duration (minutes):", kind="int", default="60", required=True),
+    Field("slot_type", "Slot Type:", kind="choice", choices=["lecture", "lab"], default="lecture"),
+]
+GENERATE_FORM = [
+    Field("program", "Program:", choices=[], required=True),
+    Field("semester", "Semester:", kind="int", choices=[str(i) for i in range(1, 9)], required=True),
+]
+
 class TimetableGUI:
     def __init__(self, root):
         self.root = root
@@ -204,28 +237,7 @@ class TimetableGUI:
         add_frame = ttk.LabelFrame(tab, text="Add New Course")
         add_frame.pack(pady=10, padx=10, fill=tk.X)
         
-        ttk.Label(add_frame, text="Course Code:").grid(row=0, column=0, padx=5, pady=5)
-        self.course_code = ttk.Entry(add_frame)
-        self.course_code.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Course Name:").grid(row=1, column=0, padx=5, pady=5)
-        self.course_name = ttk.Entry(add_frame)
-        self.course_name.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Credits:").grid(row=2, column=0, padx=5, pady=5)
-        self.course_credits = ttk.Entry(add_frame)
-        self.course_credits.grid(row=2, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Lecture Hours:").grid(row=3, column=0, padx=5, pady=5)
-        self.lecture_hours = ttk.Entry(add_frame)
-        self.lecture_hours.grid(row=3, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Lab Hours:").grid(row=4, column=0, padx=5, pady=5)
-        self.lab_hours = ttk.Entry(add_frame)
-        self.lab_hours.grid(row=4, column=1, padx=5, pady=5)
-        self.lab_hours.insert(0, "0")
-        
-        ttk.Button(add_frame, text="Add Course", command=self.add_course).grid(row=5, columnspan=2, pady=10)
+        self.course_form = Form(add_frame, COURSE_FORM, self.add_course, "Add Course")
         
         # View courses frame
         view_frame = ttk.LabelFrame(tab, text="Current Courses")
@@ -248,15 +260,7 @@ class TimetableGUI:
         add_frame = ttk.LabelFrame(tab, text="Add New Faculty")
         add_frame.pack(pady=10, padx=10, fill=tk.X)
         
-        ttk.Label(add_frame, text="Faculty ID:").grid(row=0, column=0, padx=5, pady=5)
-        self.faculty_id = ttk.Entry(add_frame)
-        self.faculty_id.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Faculty Name:").grid(row=1, column=0, padx=5, pady=5)
-        self.faculty_name = ttk.Entry(add_frame)
-        self.faculty_name.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Button(add_frame, text="Add Faculty", command=self.add_faculty).grid(row=2, columnspan=2, pady=10)
+        self.faculty_form = Form(add_frame, FACULTY_FORM, self.add_faculty, "Add Faculty")
         
         # View faculty frame
         view_frame = ttk.LabelFrame(tab, text="Current Faculty")
@@ -279,20 +283,7 @@ class TimetableGUI:
         add_frame = ttk.LabelFrame(tab, text="Add New Program")
         add_frame.pack(pady=10, padx=10, fill=tk.X)
         
-        ttk.Label(add_frame, text="Program ID:").grid(row=0, column=0, padx=5, pady=5)
-        self.program_id = ttk.Entry(add_frame)
-        self.program_id.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Program Name:").grid(row=1, column=0, padx=5, pady=5)
-        self.program_name = ttk.Entry(add_frame)
-        self.program_name.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Semesters:").grid(row=2, column=0, padx=5, pady=5)
-        self.semesters = ttk.Entry(add_frame)
-        self.semesters.grid(row=2, column=1, padx=5, pady=5)
-        self.semesters.insert(0, "1,2,3,4,5,6,7,8")
-        
-        ttk.Button(add_frame, text="Add Program", command=self.add_program).grid(row=3, columnspan=2, pady=10)
+        self.program_form = Form(add_frame, PROGRAM_FORM, self.add_program, "Add Program")
         
         # View programs frame
         view_frame = ttk.LabelFrame(tab, text="Current Programs")
@@ -315,20 +306,7 @@ class TimetableGUI:
         add_frame = ttk.LabelFrame(tab, text="Add New Room")
         add_frame.pack(pady=10, padx=10, fill=tk.X)
         
-        ttk.Label(add_frame, text="Room ID:").grid(row=0, column=0, padx=5, pady=5)
-        self.room_id = ttk.Entry(add_frame)
-        self.room_id.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Capacity:").grid(row=1, column=0, padx=5, pady=5)
-        self.room_capacity = ttk.Entry(add_frame)
-        self.room_capacity.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Label(add_frame, text="Room Type:").grid(row=2, column=0, padx=5, pady=5)
-        self.room_type = ttk.Combobox(add_frame, values=["lecture", "lab"])
-        self.room_type.grid(row=2, column=1, padx=5, pady=5)
-        self.room_type.set("lecture")
-        
-        ttk.Button(add_frame, text="Add Room", command=self.add_room).grid(row=3, columnspan=2, pady=10)
+        self.room_form = Form(add_frame, ROOM_FORM, self.add_room, "Add Room")
         
         # View rooms frame
         view_frame = ttk.LabelFrame(tab, text="Current Rooms")
@@ -351,27 +329,7 @@ class TimetableGUI:
         add_frame = ttk.LabelFrame(tab, text="Add Time Slots")
         add_frame.pack(pady=10, padx=10, fill=tk.X)
         
-        ttk.Label(add_frame, text="Days (comma separated):").grid(row=0, column=0, padx=5, pady=5)
-        self.days_entry = ttk.Entry(add_frame)
-        self.days_entry.grid(row=0, column=1, padx=5, pady=5)
-        self.days_entry.insert(0, "Monday,Tuesday,Wednesday,Thursday,Friday")
-        
-        ttk.Label(add_frame, text="Start Times (comma separated):").grid(row=1, column=0, padx=5, pady=5)
-        self.start_times = ttk.Entry(add_frame)
-        self.start_times.grid(row=1, column=1, padx=5, pady=5)
-        self.start_times.insert(0, "09:00,11:00,14:00,16:00")
-        
-        ttk.Label(add_frame, text="Duration (minutes):").grid(row=2, column=0, padx=5, pady=5)
-        self.duration = ttk.Entry(add_frame)
-        self.duration.grid(row=2, column=1, padx=5, pady=5)
-        self.duration.insert(0, "60")
-        
-        ttk.Label(add_frame, text="Slot Type:").grid(row=3, column=0, padx=5, pady=5)
-        self.slot_type = ttk.Combobox(add_frame, values=["lecture", "lab"])
-        self.slot_type.grid(row=3, column=1, padx=5, pady=5)
-        self.slot_type.set("lecture")
-        
-        ttk.Button(add_frame, text="Add Time Slots", command=self.add_time_slots).grid(row=4, columnspan=2, pady=10)
+        self.timeslot_form = Form(add_frame, TIMESLOT_FORM, self.add_time_slots, "Add Time Slots", reset=False)
         
         # View timeslots frame
         view_frame = ttk.LabelFrame(tab, text="Current Time Slots")
@@ -394,15 +352,8 @@ class TimetableGUI:
         gen_frame = ttk.LabelFrame(tab, text="Generate Timetable")
         gen_frame.pack(pady=10, padx=10, fill=tk.X)
         
-        ttk.Label(gen_frame, text="Program:").grid(row=0, column=0, padx=5, pady=5)
-        self.program_combo = ttk.Combobox(gen_frame)
-        self.program_combo.grid(row=0, column=1, padx=5, pady=5)
-        
-        ttk.Label(gen_frame, text="Semester:").grid(row=1, column=0, padx=5, pady=5)
-        self.semester_combo = ttk.Combobox(gen_frame, values=[str(i) for i in range(1, 9)])
-        self.semester_combo.grid(row=1, column=1, padx=5, pady=5)
-        
-        ttk.Button(gen_frame, text="Generate Timetable", command=self.generate_timetable).grid(row=2, columnspan=2, pady=10)
+        self.generate_form = Form(gen_frame, GENERATE_FORM, self.generate_timetable, "Generate Timetable", reset=False)
+        self.program_combo = self.generate_form.inputs["program"]
         
         # Display frame
         display_frame = ttk.LabelFrame(tab, text="Timetable")
@@ -615,130 +566,42 @@ class TimetableGUI:
         if programs:
             self.program_combo.set(programs[0])
     
-    def add_course(self):
-        try:
-            code = self.course_code.get().strip()
-            name = self.course_name.get().strip()
-            credits = int(self.course_credits.get())
-            lecture_hours = int(self.lecture_hours.get())
-            lab_hours = int(self.lab_hours.get())
-            
-            if not code or not name:
-                raise ValueError("Course code and name are required")
-            
-            self.generator.add_course(code, name, credits, lecture_hours, lab_hours)
-            self.refresh_all_views()
-            messagebox.showinfo("Success", "Course added successfully")
-            
-            # Clear fields
-            self.course_code.delete(0, tk.END)
-            self.course_name.delete(0, tk.END)
-            self.course_credits.delete(0, tk.END)
-            self.lecture_hours.delete(0, tk.END)
-            self.lab_hours.delete(0, tk.END)
-            self.lab_hours.insert(0, "0")
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {e}")
+    # The forms parse and validate as fields are edited, so each handler gets
+    # typed values; a ValueError raised here is shown under the form
+    def add_course(self, values):
+        self.generator.add_course(values["code"], values["name"], values["credits"],
+                                  values["lecture_hours"], values["lab_hours"])
+        self.refresh_all_views()
+        messagebox.showinfo("Success", "Course added successfully")
     
-    def add_faculty(self):
-        try:
-            faculty_id = self.faculty_id.get().strip()
-            name = self.faculty_name.get().strip()
-            
-            if not faculty_id or not name:
-                raise ValueError("Faculty ID and name are required")
-            
-            self.generator.add_faculty(faculty_id, name)
-            self.refresh_all_views()
-            messagebox.showinfo("Success", "Faculty added successfully")
-            
-            # Clear fields
-            self.faculty_id.delete(0, tk.END)
-            self.faculty_name.delete(0, tk.END)
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {e}")
+    def add_faculty(self, values):
+        self.generator.add_faculty(values["faculty_id"], values["name"])
+        self.refresh_all_views()
+        messagebox.showinfo("Success", "Faculty added successfully")
     
-    def add_program(self):
-        try:
-            program_id = self.program_id.get().strip()
-            name = self.program_name.get().strip()
-            semesters = self.semesters.get().strip()
-            
-            if not program_id or not name or not semesters:
-                raise ValueError("All fields are required")
-            
-            semester_list = [s.strip() for s in semesters.split(",")]
-            semester_dict = {}
-            
-            for sem in semester_list:
-                semester_dict[int(sem)] = []  # Empty course list for now
-            
-            self.generator.add_program(program_id, name, semester_dict)
-            self.refresh_all_views()
-            messagebox.showinfo("Success", "Program added successfully")
-            
-            # Clear fields
-            self.program_id.delete(0, tk.END)
-            self.program_name.delete(0, tk.END)
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {e}")
+    def add_program(self, values):
+        semester_dict = {sem: [] for sem in values["semesters"]}  # Empty course list for now
+        self.generator.add_program(values["program_id"], values["name"], semester_dict)
+        self.refresh_all_views()
+        messagebox.showinfo("Success", "Program added successfully")
     
-    def add_room(self):
-        try:
-            room_id = self.room_id.get().strip()
-            capacity = int(self.room_capacity.get())
-            room_type = self.room_type.get()
-            
-            if not room_id:
-                raise ValueError("Room ID is required")
-            
-            self.generator.add_room(room_id, capacity, room_type)
-            self.refresh_all_views()
-            messagebox.showinfo("Success", "Room added successfully")
-            
-            # Clear fields
-            self.room_id.delete(0, tk.END)
-            self.room_capacity.delete(0, tk.END)
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {e}")
+    def add_room(self, values):
+        self.generator.add_room(values["room_id"], values["capacity"], values["room_type"])
+        self.refresh_all_views()
+        messagebox.showinfo("Success", "Room added successfully")
     
-    def add_time_slots(self):
-        try:
-            days = [d.strip() for d in self.days_entry.get().split(",")]
-            start_times = [t.strip() for t in self.start_times.get().split(",")]
-            duration = int(self.duration.get())
-            slot_type = self.slot_type.get()
-            
-            if not days or not start_times:
-                raise ValueError("Days and start times are required")
-            
-            self.generator.set_time_slots(days, start_times, duration, slot_type)
-            self.refresh_all_views()
-            messagebox.showinfo("Success", "Time slots added successfully")
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {e}")
+    def add_time_slots(self, values):
+        self.generator.set_time_slots(values["days"], values["start_times"], values["duration"], values["slot_type"])
+        self.refresh_all_views()
+        messagebox.showinfo("Success", "Time slots added successfully")
     
-    def generate_timetable(self):
-        try:
-            program_id = self.program_combo.get()
-            semester = int(self.semester_combo.get())
-            
-            if not program_id:
-                raise ValueError("Please select a program")
-            
-            self.generator.generate_semester_timetable(program_id, semester)
-            timetable_text = self.generator.get_semester_timetable_text(program_id, semester)
-            
-            self.timetable_display.delete(1.0, tk.END)
-            self.timetable_display.insert(tk.END, timetable_text)
-            
-        except ValueError as e:
-            messagebox.showerror("Error", f"Invalid input: {e}")
+    def generate_timetable(self, values):
+        program_id, semester = values["program"], values["semester"]
+        self.generator.generate_semester_timetable(program_id, semester)
+        timetable_text = self.generator.get_semester_timetable_text(program_id, semester)
+        
+        self.timetable_display.delete(1.0, tk.END)
+        self.timetable_display.insert(tk.END, timetable_text)
 
 def main():
     root = tk.Tk()